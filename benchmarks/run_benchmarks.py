@@ -0,0 +1,254 @@
+"""
+Benchmarks of the built in serialisable types.
+Measures encode and decode throughput, peak memory and output size across payload sizes,
+string lengths, list nesting depth and object field counts, and writes the results as JSON.
+Results can be compared against a stored baseline to catch regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --quick --baseline results.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main.serialise_data import SerialiseData  # noqa: E402
+from src.main.types import SerialisableInt, SerialisableList, SerialisableObject, \
+    SerialisableString, SerialisableVarString  # noqa: E402
+
+SIZES = [1, 100, 10 ** 4, 10 ** 6]
+QUICK_SIZES = [1, 100, 10 ** 4]
+STRING_LENGTHS = [8, 64, 1024]
+NESTING_DEPTHS = [1, 2, 3, 4]
+FIELD_COUNTS = [1, 8, 32]
+MAX_OBJECT_LIST_SIZE = 10 ** 5  # Larger lists of objects take minutes per round.
+
+
+class Case:
+    """
+    Single benchmark case.
+    Encodes the value with the serialisable and decodes the result back.
+    """
+
+    def __init__(self, name: str, serialisable, value, items: int, **params) -> None:
+        """
+        Initialise the case.
+        :param name: str: Name of the benchmarked type.
+        :param serialisable: Serialisable: Serialisable instance to encode and decode with.
+        :param value: object: The value to encode.
+        :param items: int: Number of elements of the value, for objects/s.
+        :param params: Parameters of the case, part of the case's key.
+        """
+        self.name = name
+        self.serialisable = serialisable
+        self.value = value
+        self.items = items
+        self.params = params
+
+    @property
+    def key(self) -> str:
+        params = sorted(self.params.items())
+        return self.name + "".join(f" {name}={value}" for name, value in params)
+
+    def encode(self):
+        return self.serialisable.serialise(self.value)
+
+    def decode(self, data):
+        data.set_pointer(0)
+        return self.serialisable.deseralise(data)
+
+
+def _object_type(field_count: int) -> type:
+    """
+    Create a SerialisableObject subclass with field_count fields of mixed types.
+    """
+    fields = []
+    for index in range(field_count):
+        if index % 2:
+            fields.append(SerialiseData(f"field_{index}", SerialisableVarString()))
+        else:
+            fields.append(SerialiseData(f"field_{index}", SerialisableInt(0, 16)))
+
+    def __init__(self):
+        SerialisableObject.__init__(self)
+        for index in range(field_count):
+            setattr(self, f"field_{index}", f"value {index}" if index % 2 else index)
+
+    return type(f"Object{field_count}", (SerialisableObject,),
+                {"version_map": {0: fields}, "__init__": __init__})
+
+
+def _nested_list(depth: int, width: int):
+    """
+    Create a list nested depth levels deep with width items per level, and its serialisable.
+    """
+    serialisable = SerialisableInt(0, 16)
+    value = 1
+    for _ in range(depth):
+        serialisable = SerialisableList(list_type=serialisable, max_list_length=width)
+        value = [value] * width
+    return serialisable, value
+
+
+def build_cases(sizes: list) -> list:
+    """
+    Build every benchmark case.
+    :param sizes: list: Numbers of elements of the sized cases.
+    :return: list: The cases.
+    """
+    cases = []
+    object_type = _object_type(8)
+    for size in sizes:
+        length_size = max(size, 1)
+        cases.append(Case("SerialisableList[SerialisableInt]",
+                          SerialisableList(list_type=SerialisableInt(0, 16),
+                                           max_list_length=length_size),
+                          [index & 0xFFFF for index in range(size)], size, size=size))
+        cases.append(Case("SerialisableList[SerialisableString]",
+                          SerialisableList(list_type=SerialisableString(str_length=16),
+                                           max_list_length=length_size),
+                          [f"item {index}" for index in range(size)], size, size=size))
+        if size <= MAX_OBJECT_LIST_SIZE:
+            cases.append(Case("SerialisableList[SerialisableObject]",
+                              SerialisableList(list_type=object_type(),
+                                               max_list_length=length_size),
+                              [object_type() for _ in range(size)], size, size=size))
+    for str_length in STRING_LENGTHS:
+        cases.append(Case("SerialisableString", SerialisableString(str_length=str_length),
+                          "x" * str_length, 1, str_length=str_length))
+        cases.append(Case("SerialisableVarString",
+                          SerialisableVarString(max_str_length=str_length),
+                          "x" * str_length, 1, str_length=str_length))
+    for depth in NESTING_DEPTHS:
+        width = max(int(round(4096 ** (1 / depth))), 2)
+        serialisable, value = _nested_list(depth, width)
+        cases.append(Case("SerialisableList nested", serialisable, value, width ** depth,
+                          depth=depth))
+    for field_count in FIELD_COUNTS:
+        object_type = _object_type(field_count)
+        cases.append(Case("SerialisableObject", object_type(), object_type(), 1,
+                          fields=field_count))
+    return cases
+
+
+def _time(function, min_time: float, repeat: int) -> float:
+    """
+    Get the best time of one call of the function.
+    Each of repeat rounds calls the function until min_time has passed.
+    """
+    best = None
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0
+        while calls == 0 or elapsed < min_time:
+            function()
+            calls += 1
+            elapsed = time.perf_counter() - start
+        best = elapsed / calls if best is None else min(best, elapsed / calls)
+    return best
+
+
+def _peak_memory(function) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(case: Case, min_time: float, repeat: int) -> dict:
+    """
+    Run a benchmark case.
+    :return: dict: The measurements of the case.
+    """
+    data = case.encode()
+    byte_size = (data.bit_length + 7) >> 3
+    encode_time = _time(case.encode, min_time, repeat)
+    decode_time = _time(lambda: case.decode(data), min_time, repeat)
+    return {
+        "name": case.name,
+        "params": case.params,
+        "output_bits": data.bit_length,
+        "encode_seconds": encode_time,
+        "decode_seconds": decode_time,
+        "encode_objects_per_second": case.items / encode_time,
+        "decode_objects_per_second": case.items / decode_time,
+        "encode_mb_per_second": byte_size / encode_time / 1e6,
+        "decode_mb_per_second": byte_size / decode_time / 1e6,
+        "encode_peak_bytes": _peak_memory(case.encode),
+        "decode_peak_bytes": _peak_memory(lambda: case.decode(data)),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compare results against a baseline.
+    :param results: dict: Results keyed by case key.
+    :param baseline: dict: Baseline results keyed by case key.
+    :param threshold: float: Allowed relative slow down, 0.1 is 10%.
+    :return: list: Descriptions of every regression.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric in ("encode_seconds", "decode_seconds"):
+            if result[metric] > base[metric] * (1 + threshold):
+                regressions.append(f"{key}: {metric} {base[metric]:.3g} -> {result[metric]:.3g} "
+                                   f"({result[metric] / base[metric] - 1:+.0%})")
+        if result["output_bits"] != base["output_bits"]:
+            regressions.append(f"{key}: output_bits {base['output_bits']} -> "
+                               f"{result['output_bits']}")
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare the results against this JSON file.")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Allowed relative slow down against the baseline. Default 0.1.")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"Only run sizes up to {QUICK_SIZES[-1]} with shorter timings.")
+    parser.add_argument("--filter", default="", help="Only run cases whose key contains this.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing rounds per case.")
+    args = parser.parse_args(argv)
+
+    min_time = 0.05 if args.quick else 0.2
+    results = {}
+    for case in build_cases(QUICK_SIZES if args.quick else SIZES):
+        if args.filter not in case.key:
+            continue
+        result = run_case(case, min_time, args.repeat)
+        results[case.key] = result
+        print(f"{case.key:<55} encode {result['encode_objects_per_second']:>12,.0f} obj/s "
+              f"{result['encode_mb_per_second']:>8.2f} MB/s  decode "
+              f"{result['decode_objects_per_second']:>12,.0f} obj/s "
+              f"{result['decode_mb_per_second']:>8.2f} MB/s")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "results": results}, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
 from .data_pointer import DataPointer
+from .bit_reader import BitReader
+from .data_reader import DataReader
 from .data_storage import StoredData
+from .mapped_data_storage import MappedStoredData
 from .serialisable import Serialisable
@@ -0,0 +1,113 @@
+import asyncio
+
+from src.main import Serialisable, StoredData
+from src.main.record_stream import BLOCK_MARKER, FRAME_HEADER, INDEX_MARKER, deserialise_record, \
+    frame, serialise_record
+
+
+async def read_message_data(reader: asyncio.StreamReader,
+                            max_record_size: int = None) -> StoredData:
+    """
+    Read the next framed message's encoded data from an asyncio stream.
+    Messages use the RecordWriter frame format, a 4 byte big endian bit length followed by the
+    packed bytes of the message.
+    :param reader: asyncio.StreamReader: The stream to read the message from.
+    :param max_record_size: int: Largest message in bytes that will be read. Default no limit.
+    :return: StoredData: The encoded message or None if the stream ended between messages.
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as error:
+        if not error.partial:
+            return None
+        raise ValueError("Unable to read message. The stream ended inside a message header.")
+    bit_length, = FRAME_HEADER.unpack(header)
+    if bit_length == INDEX_MARKER:
+        return None  # Reached an index footer.
+    if bit_length == BLOCK_MARKER:
+        raise ValueError("Unable to read message. Compressed record blocks are not supported "
+                         "on message streams.")
+    byte_length = (bit_length + 7) >> 3
+    if max_record_size is not None and byte_length > max_record_size:
+        raise ValueError(f"Unable to read message of {byte_length} bytes. Messages are limited "
+                         f"to {max_record_size} bytes.")
+    try:
+        payload = await reader.readexactly(byte_length)
+    except asyncio.IncompleteReadError:
+        raise ValueError("Unable to read message. The stream ended inside a message.")
+    return StoredData.from_bytes(payload, bit_length)
+
+
+async def read_message(reader: asyncio.StreamReader, record_type: Serialisable,
+                       max_record_size: int = None) -> object:
+    """
+    Read and decode the next framed message from an asyncio stream.
+    :param reader: asyncio.StreamReader: The stream to read the message from.
+    :param record_type: Serialisable: Serialisable instance or class to decode the message with.
+    :param max_record_size: int: Largest message in bytes that will be read. Default no limit.
+    :return: object: The decoded message or None if the stream ended between messages.
+    """
+    data = await read_message_data(reader, max_record_size)
+    if data is None:
+        return None
+    return deserialise_record(data, record_type)
+
+
+async def iter_messages(reader: asyncio.StreamReader, record_type: Serialisable,
+                        max_record_size: int = None):
+    """
+    Decode every framed message of an asyncio stream until it ends.
+    :param reader: asyncio.StreamReader: The stream to read the messages from.
+    :param record_type: Serialisable: Serialisable instance or class to decode the messages with.
+    :param max_record_size: int: Largest message in bytes that will be read. Default no limit.
+    :return: Async generator of the decoded messages.
+    """
+    while True:
+        data = await read_message_data(reader, max_record_size)
+        if data is None:
+            return
+        yield deserialise_record(data, record_type)
+
+
+def _frame_message(data: StoredData) -> bytes:
+    if data.bit_length >= BLOCK_MARKER:
+        raise ValueError(f"Unable to frame a message of {data.bit_length} bits.")
+    return frame(data)
+
+
+async def write_message(writer: asyncio.StreamWriter, value: object,
+                        record_type: Serialisable = None, drain: bool = True) -> int:
+    """
+    Serialise and write a framed message to an asyncio stream.
+    :param writer: asyncio.StreamWriter: The stream to write the message to.
+    :param value: object: The value to write.
+    :param record_type: Serialisable: Serialisable instance or class to encode the value with.
+        Defaults to the value itself when it is a Serialisable.
+    :param drain: bool: Whether to wait for the write buffer to drain, applying backpressure.
+    :return: int: The number of bytes written.
+    """
+    framed = _frame_message(serialise_record(value, record_type))
+    writer.write(framed)
+    if drain:
+        await writer.drain()
+    return len(framed)
+
+
+async def write_messages(writer: asyncio.StreamWriter, values, record_type: Serialisable = None,
+                         drain: bool = True) -> int:
+    """
+    Serialise many messages and write them to an asyncio stream with a single write, so a batch
+    of small messages costs one transport write instead of one per message.
+    :param writer: asyncio.StreamWriter: The stream to write the messages to.
+    :param values: Iterable of the values to write.
+    :param record_type: Serialisable: Serialisable instance or class to encode the values with.
+        Defaults to each value itself when it is a Serialisable.
+    :param drain: bool: Whether to wait for the write buffer to drain, applying backpressure.
+    :return: int: The number of bytes written.
+    """
+    framed = b"".join(_frame_message(serialise_record(value, record_type)) for value in values)
+    if framed:
+        writer.write(framed)
+    if drain:
+        await writer.drain()
+    return len(framed)
@@ -0,0 +1,80 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, callers fall back to per item encoding.
+    np = None
+
+MAX_ARRAY_BIT_SIZE = 64
+
+
+def numpy_available() -> bool:
+    """
+    Whether NumPy is installed and the vectorised bit packing helpers can be used.
+    :return: bool
+    """
+    return np is not None
+
+
+def pack_uint_array(values, bit_size: int) -> bytes:
+    """
+    Pack unsigned integers into consecutive bit_size bit fields, most significant bit first.
+    :param values: Sequence or ndarray of non negative integers or bools.
+    :param bit_size: int: Number of bits per value, at most 64.
+    :return: bytes: The packed values. The final byte is padded with 0's.
+    """
+    if not isinstance(values, np.ndarray):
+        values = _as_int_array(values, bit_size)
+    if values.dtype.kind not in "biu":
+        raise ValueError(f"Unable to pack an array of {values.dtype} into {bit_size} bits.")
+    if values.size and values.dtype.kind == "i" and values.min() < 0:
+        raise ValueError(f"Unable to pack negative values into {bit_size} bits.")
+    array = values.astype(">u8")
+    if array.ndim != 1:
+        raise ValueError(f"Unable to pack an array with {array.ndim} dimensions into a list.")
+    if bit_size < MAX_ARRAY_BIT_SIZE and array.size and (array >> np.uint64(bit_size)).any():
+        raise ValueError(f"Unable to pack values larger than {bit_size} bits.")
+    as_bytes = array.view(np.uint8).reshape(-1, 8)
+    if bit_size % 8 == 0:
+        return as_bytes[:, 8 - bit_size // 8:].tobytes()
+    bits = np.unpackbits(as_bytes, axis=1)[:, MAX_ARRAY_BIT_SIZE - bit_size:]
+    return np.packbits(bits).tobytes()
+
+
+def _as_int_array(values, bit_size: int):
+    """
+    Convert a sequence of integers to an ndarray without coercing other types to integers.
+    Integers too large for int64 are kept exactly by converting them to uint64.
+    :param values: Sequence of integers.
+    :param bit_size: int: Number of bits per value, for error messages.
+    :return: ndarray
+    """
+    array = np.asarray(values)
+    if array.dtype.kind in "biu":
+        return array
+    # Mixes of large and small integers become object or float arrays, so check each value.
+    if not all(isinstance(value, (int, np.integer)) for value in values):
+        raise ValueError(f"Unable to pack values that are not integers into {bit_size} bits.")
+    try:
+        return np.array(values, dtype=">u8")
+    except OverflowError:
+        raise ValueError(f"Unable to pack negative or oversized values into {bit_size} bits.")
+
+
+def unpack_uint_array(data: bytes, count: int, bit_size: int):
+    """
+    Unpack count consecutive bit_size bit fields packed by pack_uint_array.
+    :param data: bytes: The packed values.
+    :param count: int: The number of values to unpack.
+    :param bit_size: int: Number of bits per value, at most 64.
+    :return: ndarray: uint64 array of the values.
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    as_bytes = np.zeros((count, 8), dtype=np.uint8)
+    if bit_size % 8 == 0:
+        byte_size = bit_size // 8
+        as_bytes[:, 8 - byte_size:] = raw[:count * byte_size].reshape(count, byte_size)
+    else:
+        bits = np.unpackbits(raw, count=count * bit_size).reshape(count, bit_size)
+        padded = np.zeros((count, MAX_ARRAY_BIT_SIZE), dtype=np.uint8)
+        padded[:, MAX_ARRAY_BIT_SIZE - bit_size:] = bits
+        as_bytes = np.packbits(padded, axis=1)
+    return as_bytes.view(">u8").ravel().astype(np.uint64)
@@ -0,0 +1,159 @@
+class BitReader:
+    """
+    Bit reading interface shared by stored data and data readers.
+    Reads bits from the packed _buffer holding _data_len bits at the position of the _pointer.
+    Subclasses provide the buffer, the bit length and their own pointer.
+    The _at methods read at an explicit bit offset instead, leaving the pointer alone.
+    """
+
+    __slots__ = ()
+
+    @property
+    def bit_length(self) -> int:
+        """
+        The number of bits held in the stored data.
+        :return: int
+        """
+        return self._data_len
+
+    @property
+    def position(self) -> int:
+        """
+        The bit offset the next read will start from, including any recorded temp value.
+        :return: int
+        """
+        return self._pointer.value
+
+    def __len__(self) -> int:
+        return self._data_len
+
+    def _read_bits(self, start: int, bit_size: int) -> (int, int):
+        """
+        Read bits from the buffer without moving the pointer.
+        Reads past the end of the data are truncated.
+        :param start: int: The bit offset to read from.
+        :param bit_size: int: The number of bits to read.
+        :return: (int, int): The value of the bits read and the number of bits read.
+        """
+        end = min(start + bit_size, self._data_len)
+        if end <= start:
+            return 0, 0
+        first = start >> 3
+        last = (end + 7) >> 3
+        value = int.from_bytes(self._buffer[first:last], "big") >> ((last << 3) - end)
+        return value & ((1 << (end - start)) - 1), end - start
+
+    def get_bits(self, bit_size: int = 0) -> str:
+        """
+        Get a string of bits from the stored data of bit_size length.
+        The bits are retrieved from the pointer value. This value is effected if the pointer
+        is using a temp value.
+        :param bit_size: int: The requested length of the bits to return
+        :return: str
+        """
+        value, read_size = self._read_bits(self._pointer.value, bit_size)
+        self._pointer.increment(bit_size)  # Increment the pointer.
+        if read_size == 0:
+            return ""
+        return format(value, f"0{read_size}b")
+
+    def read_int(self, bit_size: int = 0) -> int:
+        """
+        Get the integer value of bit_size bits from the stored data.
+        Equivalent to int(get_bits(bit_size), 2) without building the string.
+        :param bit_size: int: The number of bits to read.
+        :return: int
+        """
+        value, read_size = self._read_bits(self._pointer.value, bit_size)
+        if read_size == 0:
+            raise ValueError(f"Unable to read {bit_size} bits from stored data at position "
+                             f"{self._pointer.value}.")
+        self._pointer.increment(bit_size)  # Increment the pointer.
+        return value
+
+    def read_bytes(self, bit_size: int = 0) -> bytes:
+        """
+        Get bit_size bits from the stored data as packed bytes, most significant bit first.
+        The final byte is padded with 0's.
+        :param bit_size: int: The number of bits to read.
+        :return: bytes
+        """
+        data = self.read_bytes_at(self._pointer.value, bit_size)
+        self._pointer.increment(bit_size)  # Increment the pointer.
+        return data
+
+    def read_int_at(self, offset: int, bit_size: int) -> int:
+        """
+        Get the integer value of bit_size bits starting at an explicit bit offset.
+        The pointer is not used or moved.
+        :param offset: int: The bit offset to read from.
+        :param bit_size: int: The number of bits to read.
+        :return: int
+        """
+        end = offset + bit_size
+        if bit_size <= 0 or offset < 0 or end > self._data_len:
+            raise ValueError(f"Unable to read {bit_size} bits from stored data at position "
+                             f"{offset}.")
+        first = offset >> 3
+        last = (end + 7) >> 3
+        value = int.from_bytes(self._buffer[first:last], "big") >> ((last << 3) - end)
+        return value & ((1 << bit_size) - 1)
+
+    def read_bytes_at(self, offset: int, bit_size: int) -> bytes:
+        """
+        Get bit_size bits starting at an explicit bit offset as packed bytes, most significant
+        bit first. The final byte is padded with 0's. The pointer is not used or moved.
+        :param offset: int: The bit offset to read from.
+        :param bit_size: int: The number of bits to read.
+        :return: bytes
+        """
+        if bit_size < 0 or offset < 0 or offset + bit_size > self._data_len:
+            raise ValueError(f"Unable to read {bit_size} bits from stored data at position "
+                             f"{offset}.")
+        if bit_size == 0:
+            return b""
+        byte_size = (bit_size + 7) >> 3
+        if offset & 7 == 0:
+            data = bytes(self._buffer[offset >> 3:(offset >> 3) + byte_size])
+            if bit_size & 7:
+                data = data[:-1] + bytes([data[-1] & (0xFF << (8 - (bit_size & 7))) & 0xFF])
+            return data
+        value = self.read_int_at(offset, bit_size)
+        return (value << ((byte_size << 3) - bit_size)).to_bytes(byte_size, "big")
+
+    def skip_bits(self, bit_size: int) -> None:
+        """
+        Move the pointer forward by bit_size bits without reading them.
+        :param bit_size: int: The number of bits to skip.
+        :return: None
+        """
+        self._pointer.increment(bit_size)
+
+    def record_pointer(self) -> None:
+        """
+        Record the pointer.
+        :return: None
+        """
+        self._pointer.record()
+
+    def reset_pointer(self) -> None:
+        """
+        Reset the pointer.
+        :return: None
+        """
+        self._pointer.reset()
+
+    def set_pointer(self, value: int = 0) -> None:
+        """
+        Set the pointer value.
+        :param value: int: The new value for the pointer.
+        :return:
+        """
+        self._pointer.value = value
+
+    def update_pointer(self) -> None:
+        """
+        Update pointer. Set's the new pointer value based on the temp value.
+        :return:
+        """
+        self._pointer.update()
@@ -0,0 +1,96 @@
+import struct
+import zlib
+
+try:
+    import bz2
+except ImportError:  # pragma: no cover - Python builds without bz2.
+    bz2 = None
+
+try:
+    import lzma
+except ImportError:  # pragma: no cover - Python builds without lzma.
+    lzma = None
+
+COMPRESSION_HEADER = struct.Struct(">4sBQ")  # Magic, codec id, raw bit length.
+COMPRESSION_MAGIC = b"\x89SDC"
+
+_codecs = {}  # Codec id to (name, compress, decompress).
+_codec_ids = {}  # Codec name to codec id.
+
+
+def register_compression(codec_id: int, name: str, compress, decompress) -> None:
+    """
+    Register a compression codec.
+    :param codec_id: int: Id written to the header of compressed data, 0 to 255.
+    :param name: str: Name the codec is selected by.
+    :param compress: Function compressing bytes to bytes.
+    :param decompress: Function decompressing bytes to bytes.
+    :return: None
+    """
+    if not 0 <= codec_id <= 0xFF:
+        raise ValueError(f"Unable to register compression {name}. Codec ids are 0 to 255 but got "
+                         f"{codec_id}.")
+    if codec_id in _codecs and _codecs[codec_id][0] != name:
+        raise ValueError(f"Unable to register compression {name}. Codec id {codec_id} is used by "
+                         f"{_codecs[codec_id][0]}.")
+    _codecs[codec_id] = (name, compress, decompress)
+    _codec_ids[name] = codec_id
+
+
+def compression_id(compression) -> int:
+    """
+    Get the id of a registered compression codec.
+    :param compression: str or int: The name or id of the codec.
+    :return: int
+    """
+    codec_id = _codec_ids.get(compression, compression)
+    if codec_id not in _codecs:
+        raise ValueError(f"Unknown compression {compression}. Registered compressions are "
+                         f"{sorted(_codec_ids)}.")
+    return codec_id
+
+
+def compress(data: bytes, bit_length: int, compression) -> bytes:
+    """
+    Compress packed bytes behind a header holding the codec id and the raw bit length.
+    :param data: bytes: The packed bytes.
+    :param bit_length: int: The number of bits held in the packed bytes.
+    :param compression: str or int: The name or id of the codec.
+    :return: bytes: The header and compressed bytes.
+    """
+    codec_id = compression_id(compression)
+    header = COMPRESSION_HEADER.pack(COMPRESSION_MAGIC, codec_id, bit_length)
+    return header + _codecs[codec_id][1](bytes(data))
+
+
+def is_compressed(data: bytes) -> bool:
+    """
+    Check whether the bytes start with a compression header.
+    :param data: bytes: Bytes like object.
+    :return: bool
+    """
+    return bytes(data[:len(COMPRESSION_MAGIC)]) == COMPRESSION_MAGIC
+
+
+def decompress(data: bytes) -> (bytes, int):
+    """
+    Decompress bytes written by compress.
+    :param data: bytes: The header and compressed bytes.
+    :return: (bytes, int): The packed bytes and the number of bits held in them.
+    """
+    if len(data) < COMPRESSION_HEADER.size or not is_compressed(data):
+        raise ValueError("Unable to decompress data without a compression header.")
+    _, codec_id, bit_length = COMPRESSION_HEADER.unpack_from(data)
+    if codec_id not in _codecs:
+        raise ValueError(f"Unable to decompress data of unknown compression id {codec_id}.")
+    raw = _codecs[codec_id][2](bytes(data[COMPRESSION_HEADER.size:]))
+    if bit_length > len(raw) * 8:
+        raise ValueError(f"Unable to decompress {bit_length} bits from {len(raw)} bytes.")
+    return raw, bit_length
+
+
+register_compression(1, "zlib", zlib.compress, zlib.decompress)
+if bz2 is not None:
+    register_compression(2, "bz2", bz2.compress, bz2.decompress)
+if lzma is not None:
+    register_compression(3, "lzma", lzma.compress, lzma.decompress)
@@ -7,6 +7,8 @@ class DataPointer:
     value for the data storage.
     """
 
+    __slots__ = ("_value", "_temp_value", "_use_temp_value")
+
     def __init__(self, value: int = 0):
         """
         Initialise the data pointer class.
@@ -76,4 +78,4 @@ class DataPointer:
         """
         self._use_temp_value = 0
         self.value = self._value + self._temp_value
-        self._temp_value = 0
\ No newline at end of file
+        self._temp_value = 0
@@ -0,0 +1,41 @@
+from src.main import BitReader, DataPointer
+
+
+class DataReader(BitReader):
+    """
+    Independent cursor over stored data.
+    Holds its own data pointer and reads the bits of the shared stored data without copying
+    them. Readers never change the stored data, so any number of threads or tasks can each use
+    their own reader over the same data at once, provided nothing is appended meanwhile.
+    Readers can be passed anywhere stored data is decoded from.
+    """
+
+    __slots__ = ("_data", "_pointer")
+
+    def __init__(self, data, offset: int = 0) -> None:
+        """
+        Initialise the data reader.
+        :param data: StoredData: The stored data to read.
+        :param offset: int: Bit offset to start reading from.
+        """
+        self._data = data
+        self._pointer = DataPointer(offset)
+
+    @property
+    def _buffer(self):
+        return self._data._buffer
+
+    @property
+    def _data_len(self) -> int:
+        return self._data._data_len
+
+    def reader(self, offset: int = None):
+        """
+        Create another independent reader over the same stored data.
+        :param offset: int: Bit offset the reader starts at. Defaults to the current position.
+        :return: DataReader
+        """
+        return DataReader(self._data, self.position if offset is None else offset)
+
+    def to_bytes(self, compression=None) -> bytes:
+        return self._data.to_bytes(compression)
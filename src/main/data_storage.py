@@ -1,14 +1,22 @@
 import re
 
-from src.main import DataPointer
+from src.main import BitReader, DataPointer, DataReader
+from src.main.compression import compress, decompress, is_compressed
 
+BINARY_PATTERN = re.compile("[01]+")
 
-class StoredData:
+
+class StoredData(BitReader):
     """
     Holds the stored bytes of data.
+    Bits are packed most significant bit first into a bytearray, with a bit length counter
+    keeping track of how many bits of the final byte are in use.
     Uses data pointer class to point and retrieve data from the object.
+    Independent readers over the same data can be created with reader.
     """
 
+    __slots__ = ("_data_len", "_buffer", "_pointer")
+
     def __init__(self, data: str = "", data_size: int = None) -> None:
         """
         Initialise the stored data.
@@ -16,7 +24,7 @@ class StoredData:
         :param data_size: Expected data size. Pad the data with leading zeros if not same length.
         """
         self._data_len = 0
-        self._data = ""
+        self._buffer = bytearray()
         self.add_data(data, data_size)
         self._pointer = DataPointer(0)
 
@@ -33,60 +41,143 @@ class StoredData:
         if not isinstance(data, str):
             raise ValueError(f"Invalid data provided to append to stored data. Expected binary str "
                              f"representation but got: {type(data)}")
-        if not re.fullmatch("[01]+", data):
-            raise ValueError(f"Invalid data provided to append to stored data. Expted a binary str "
-                             f"representation but got {data}")
         data_len = len(data)
         if data_len == 0:
             return
+        if not BINARY_PATTERN.fullmatch(data):
+            raise ValueError(f"Invalid data provided to append to stored data. Expted a binary str "
+                             f"representation but got {data}")
         if isinstance(data_size, int) and data_len < data_size:
-            self._data += data.zfill(data_size)
-            self._data_len += data_size
-        else:
-            self._data += data
-            self._data_len += data_len
+            data_len = data_size
+        self._append_bits(int(data, 2), data_len)
 
-    def get_bits(self, bit_size: int = 0) -> str:
+    def add_int(self, value: int, data_size: int = None) -> None:
         """
-        Get a string of bits from the stored data of bit_size length.
-        The bits are retrieved from the pointer value. This value is effected if the pointer
-        is using a temp value.
-        :param bit_size: int: The requested length of the bits to return
-        :return: str
+        Add the binary representation of an integer to the internal data.
+        Behaves as add_data(bin(value)[2:], data_size) without building the string.
+        :param value: int: The non negative integer to append.
+        :param data_size: int: Default None or the number of bits to pad the value to.
+        :return: None
         """
-        start = self._pointer.value
-        data = self._data[start:start + bit_size]
-        self._pointer.increment(bit_size)  # Increment the pointer.
-        return data
+        if value < 0:
+            raise ValueError(f"Invalid data provided to append to stored data. Expected a non "
+                             f"negative integer but got {value}")
+        data_len = value.bit_length() or 1
+        if isinstance(data_size, int) and data_len < data_size:
+            data_len = data_size
+        self._append_bits(value, data_len)
 
-    def record_pointer(self) -> None:
+    def add_bytes(self, data: bytes, bit_size: int = None) -> None:
         """
-        Record the pointer.
+        Add packed bytes to the internal data.
+        :param data: bytes: Bytes like object holding the bits most significant bit first.
+        :param bit_size: int: Number of bits of data to add. Defaults to every bit of data.
         :return: None
         """
-        self._pointer.record()
+        byte_len = len(data)
+        if bit_size is None:
+            bit_size = byte_len * 8
+        if bit_size <= 0:
+            return
+        if bit_size > byte_len * 8:
+            raise ValueError(f"Unable to add {bit_size} bits from {byte_len} bytes of data.")
+        if self._data_len & 7 == 0:
+            byte_size = (bit_size + 7) >> 3
+            self._buffer += data[:byte_size]
+            if bit_size & 7:
+                self._buffer[-1] &= (0xFF << (8 - (bit_size & 7))) & 0xFF
+            self._data_len += bit_size
+            return
+        value = int.from_bytes(data, "big") >> (byte_len * 8 - bit_size)
+        self._append_bits(value, bit_size)
 
-    def reset_pointer(self) -> None:
+    def add_from(self, other: BitReader, offset: int = 0) -> None:
         """
-        Reset the pointer.
+        Add the bits of other stored data from a bit offset to its end.
+        :param other: BitReader: The data to copy the bits from.
+        :param offset: int: The bit offset of the first bit to add.
         :return: None
         """
-        self._pointer.reset()
+        bit_size = other.bit_length - offset
+        if offset == 0:
+            self.add_bytes(other._buffer, bit_size)
+            return
+        self.add_bytes(other.read_bytes_at(offset, bit_size), bit_size)
+
+    @classmethod
+    def aligned_to(cls, bit_offset: int):
+        """
+        Create stored data starting with bit_offset % 8 zero bits.
+        Values encoded into it start at the same bit of a byte as they would at bit_offset, so
+        byte aligned values such as SerialisableArray encode to the same bits as when encoded at
+        bit_offset directly. Add them after the leading zeros with add_from.
+        :param bit_offset: int: The bit offset the encoded values will be added at.
+        :return: StoredData
+        """
+        stored_data = cls()
+        if bit_offset & 7:
+            stored_data._append_bits(0, bit_offset & 7)
+        return stored_data
 
-    def set_pointer(self, value: int = 0) -> None:
+    def _append_bits(self, value: int, bit_size: int) -> None:
         """
-        Set the pointer value.
-        :param value: int: The new value for the pointer.
-        :return:
+        Append the lowest bit_size bits of value to the buffer.
+        :param value: int: Value holding the bits to append.
+        :param bit_size: int: The number of bits to append.
+        :return: None
         """
-        self._pointer.value = value
+        used = self._data_len & 7
+        if used:
+            free = 8 - used
+            if bit_size <= free:
+                self._buffer[-1] |= value << (free - bit_size)
+                self._data_len += bit_size
+                return
+            bit_size -= free
+            self._buffer[-1] |= value >> bit_size
+            value &= (1 << bit_size) - 1
+            self._data_len += free
+        byte_size = (bit_size + 7) >> 3
+        self._buffer += (value << ((byte_size << 3) - bit_size)).to_bytes(byte_size, "big")
+        self._data_len += bit_size
 
-    def update_pointer(self) -> None:
+    def reader(self, offset: int = None) -> DataReader:
         """
-        Update pointer. Set's the new pointer value based on the temp value.
-        :return:
+        Create an independent reader over this data.
+        The reader has its own pointer, so any number of readers can decode different parts of
+        the data at once without affecting each other or this object's pointer.
+        :param offset: int: Bit offset the reader starts at. Defaults to the current position.
+        :return: DataReader
         """
-        self._pointer.update()
+        return DataReader(self, self.position if offset is None else offset)
+
+    def to_bytes(self, compression=None) -> bytes:
+        """
+        Get the packed bytes of the stored data. The final byte is padded with 0's.
+        :param compression: str or int: Name or id of a registered compression codec such as
+            "zlib", "bz2" or "lzma". The compressed bytes carry a header with the codec id and
+            bit length, so from_bytes restores them without a bit length. Default uncompressed.
+        :return: bytes
+        """
+        if compression is not None:
+            return compress(self._buffer, self._data_len, compression)
+        return bytes(self._buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, bit_length: int = None):
+        """
+        Create stored data from packed bytes.
+        Bytes from to_bytes with a compression are detected and decompressed when no bit length
+        is given.
+        :param data: bytes: Bytes like object holding the bits most significant bit first.
+        :param bit_length: int: The number of bits held. Defaults to every bit of data.
+        :return: StoredData
+        """
+        if bit_length is None and is_compressed(data):
+            data, bit_length = decompress(data)
+        stored_data = cls()
+        stored_data.add_bytes(data, bit_length)
+        return stored_data
 
     def __iadd__(self, other):
         """
@@ -97,8 +188,7 @@ class StoredData:
         :return:
         """
         if isinstance(other, StoredData):
-            self.add_data(other._data)
+            self.add_bytes(other._buffer, other._data_len)
         else:
             self.add_data(other)
         return self
-
@@ -0,0 +1,225 @@
+import time
+import tracemalloc
+
+profiler = None  # The active profiler. Checked by the encode and decode entry points.
+
+
+class Stat:
+    """
+    Accumulated measurements of one serialisable type or object field.
+    """
+
+    __slots__ = ("calls", "seconds", "bits", "allocated_bytes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.bits = 0
+        self.allocated_bytes = 0
+
+    def as_dict(self) -> dict:
+        return {"calls": self.calls, "seconds": self.seconds, "bits": self.bits,
+                "allocated_bytes": self.allocated_bytes}
+
+
+class Profiler:
+    """
+    Collects call counts, cumulative time, bits and allocations of encodes and decodes.
+    Measurements are kept per serialisable type and per field of serialisable objects, where
+    fixed width fields fused into one step by the object's codec are measured together.
+    Times and bits of a type include the types nested inside it.
+    Only one profiler is active at a time, for every thread. Use it as a context manager, or
+    with enable and disable. While no profiler is active encodes and decodes only pay for one
+    check of the module's profiler.
+    """
+
+    def __init__(self, allocations: bool = False, callback=None) -> None:
+        """
+        Initialise the profiler.
+        :param allocations: bool: Whether to measure the net bytes allocated with tracemalloc.
+            Slows down encodes and decodes considerably.
+        :param callback: Function called after every measured call with the kind, "encode" or
+            "decode", the key of the type or field, the seconds taken and the bits encoded or
+            decoded.
+        """
+        self.allocations = allocations
+        self.callback = callback
+        self.types = {}
+        self.fields = {}
+        self._previous = None
+        self._started_tracing = False
+
+    def reset(self) -> None:
+        """
+        Drop every measurement.
+        :return: None
+        """
+        self.types = {}
+        self.fields = {}
+
+    def _record(self, stats: dict, kind: str, key: str, seconds: float, bits: int,
+                allocated: int) -> None:
+        stat = stats.get((kind, key))
+        if stat is None:
+            stat = stats[(kind, key)] = Stat()
+        stat.calls += 1
+        stat.seconds += seconds
+        stat.bits += bits
+        stat.allocated_bytes += allocated
+        if self.callback is not None:
+            self.callback(kind, key, seconds, bits)
+
+    def _memory(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.allocations else 0
+
+    def encode_into(self, cls: type, data, value: object, args: tuple, kwargs: dict):
+        """
+        Measure Serialisable.encode_into.
+        :return: StoredData: The provided data.
+        """
+        start_bits = data.bit_length
+        start_memory = self._memory()
+        start = time.perf_counter()
+        cls._encode_into(data, value, *args, **kwargs)
+        seconds = time.perf_counter() - start
+        self._record(self.types, "encode", cls.__qualname__, seconds,
+                     data.bit_length - start_bits, self._memory() - start_memory)
+        return data
+
+    def decode_at(self, cls: type, data, offset: int, args: tuple, kwargs: dict):
+        """
+        Measure Serialisable.decode_at.
+        :return: (object, int): The decoded object and the bit offset following it.
+        """
+        start_memory = self._memory()
+        start = time.perf_counter()
+        value, end = cls._decode_at(data, offset, *args, **kwargs)
+        seconds = time.perf_counter() - start
+        self._record(self.types, "decode", cls.__qualname__, seconds, end - offset,
+                     self._memory() - start_memory)
+        return value, end
+
+    def encode_step(self, key: str, step, data, value: object) -> None:
+        """
+        Measure encoding one step of an object codec.
+        :return: None
+        """
+        start_bits = data.bit_length
+        start_memory = self._memory()
+        start = time.perf_counter()
+        step.encode_into(data, value)
+        seconds = time.perf_counter() - start
+        self._record(self.fields, "encode", key, seconds, data.bit_length - start_bits,
+                     self._memory() - start_memory)
+
+    def decode_step(self, key: str, step, obj: object, data, offset: int) -> int:
+        """
+        Measure decoding one step of an object codec.
+        :return: int: The bit offset following the step.
+        """
+        start_memory = self._memory()
+        start = time.perf_counter()
+        end = step.decode_at(obj, data, offset)
+        seconds = time.perf_counter() - start
+        self._record(self.fields, "decode", key, seconds, end - offset,
+                     self._memory() - start_memory)
+        return end
+
+    def as_dict(self) -> dict:
+        """
+        Export the measurements.
+        :return: dict: Measurements of "types" and "fields", each keyed by "encode" and
+            "decode", then by type or field.
+        """
+        result = {}
+        for name, stats in (("types", self.types), ("fields", self.fields)):
+            result[name] = {"encode": {}, "decode": {}}
+            for (kind, key), stat in stats.items():
+                result[name][kind][key] = stat.as_dict()
+        return result
+
+    def report(self, sort: str = "seconds", limit: int = None) -> str:
+        """
+        Format the measurements as a table.
+        :param sort: str: The measurement to sort by, "calls", "seconds", "bits" or
+            "allocated_bytes".
+        :param limit: int: The maximum number of rows of each table. Default every row.
+        :return: str
+        """
+        lines = []
+        for name, stats in (("Types", self.types), ("Fields", self.fields)):
+            rows = sorted(stats.items(), key=lambda item: getattr(item[1], sort), reverse=True)
+            lines.append(f"{name}:")
+            lines.append(f"  {'kind':<7}{'key':<48}{'calls':>10}{'seconds':>12}{'bits':>14}"
+                         f"{'allocated':>12}")
+            for (kind, key), stat in rows[:limit]:
+                lines.append(f"  {kind:<7}{key:<48}{stat.calls:>10}{stat.seconds:>12.6f}"
+                             f"{stat.bits:>14}{stat.allocated_bytes:>12}")
+        return "\n".join(lines)
+
+    def enable(self):
+        """
+        Make this the active profiler. The previously active profiler is restored by disable.
+        :return: Profiler: self
+        """
+        global profiler
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._previous = profiler
+        profiler = self
+        return self
+
+    def disable(self) -> None:
+        """
+        Stop measuring and restore the previously active profiler.
+        Profilers enabled after this one stay active, with this one removed from the profilers
+        they restore.
+        :return: None
+        """
+        global profiler
+        if profiler is self:
+            profiler = self._previous
+        else:
+            later = profiler
+            while later is not None and later._previous is not self:
+                later = later._previous
+            if later is not None:
+                later._previous = self._previous
+        self._previous = None
+        if self._started_tracing:
+            self._started_tracing = False
+            tracer = profiler
+            while tracer is not None and not tracer.allocations:
+                tracer = tracer._previous
+            if tracer is not None:  # Still measuring allocations, so hand over the tracing.
+                tracer._started_tracing = True
+            else:
+                tracemalloc.stop()
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.disable()
+
+
+def enable(allocations: bool = False, callback=None) -> Profiler:
+    """
+    Create a profiler and make it the active one.
+    :param allocations: bool: Whether to measure the net bytes allocated with tracemalloc.
+    :param callback: Function called after every measured call. See Profiler.
+    :return: Profiler: The active profiler.
+    """
+    return Profiler(allocations, callback).enable()
+
+
+def disable() -> Profiler:
+    """
+    Disable the active profiler.
+    :return: Profiler: The disabled profiler or None if none was active.
+    """
+    active = profiler
+    if active is not None:
+        active.disable()
+    return active
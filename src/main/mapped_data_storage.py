@@ -0,0 +1,74 @@
+import mmap
+
+from src.main import DataPointer, StoredData
+
+
+class MappedStoredData(StoredData):
+    """
+    Read only stored data backed by a memory mapped file.
+    Bits are read straight from the mapped bytes through a memoryview, so opening a file costs
+    nothing up front and only the pages that are decoded are ever loaded.
+    """
+
+    __slots__ = ("_mmap",)
+
+    def __init__(self, file, offset: int = 0, bit_length: int = None) -> None:
+        """
+        Initialise the mapped stored data.
+        :param file: Path or binary file object with a fileno of the file to map.
+        :param offset: int: Byte offset in the file the stored data starts at.
+        :param bit_length: int: The number of bits held. Defaults to the rest of the file.
+        """
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            with open(file, "rb") as fileobj:
+                self._mmap = self._map(fileobj)
+        else:
+            self._mmap = self._map(file)
+        mapped = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        if offset < 0 or offset > len(mapped):
+            raise ValueError(f"Unable to map stored data at offset {offset} of a "
+                             f"{len(mapped)} byte file.")
+        self._buffer = mapped[offset:]
+        if bit_length is None:
+            bit_length = len(self._buffer) * 8
+        if bit_length > len(self._buffer) * 8:
+            raise ValueError(f"Unable to map {bit_length} bits from {len(self._buffer)} bytes.")
+        self._data_len = bit_length
+        self._pointer = DataPointer(0)
+
+    @staticmethod
+    def _map(fileobj):
+        """
+        Map the whole file read only.
+        :param fileobj: Binary file object with a fileno.
+        :return: mmap: The mapped file or None if the file is empty.
+        """
+        fileobj.seek(0, 2)
+        if fileobj.tell() == 0:
+            return None  # Empty files can't be mapped.
+        return mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def add_bytes(self, data: bytes, bit_size: int = None) -> None:
+        raise AttributeError("Unable to add data to read only mapped stored data.")
+
+    def _append_bits(self, value: int, bit_size: int) -> None:
+        raise AttributeError("Unable to add data to read only mapped stored data.")
+
+    def close(self) -> None:
+        """
+        Release the memoryview and unmap the file.
+        Bytes returned by read methods are copies and stay valid after closing.
+        :return: None
+        """
+        self._buffer.release()
+        self._buffer = memoryview(b"")
+        self._data_len = 0
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,181 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.main import Serialisable, StoredData
+from src.main.record_stream import serialise_record
+from src.main.serialisable import contains_type
+from src.main.types import SerialisableArray, SerialisableInt, SerialisableRef
+
+
+def _check_list_type(list_type: Serialisable, encoding: bool) -> None:
+    if contains_type(list_type, SerialisableRef):
+        raise ValueError("Unable to split a list of SerialisableRef values across workers. Back "
+                         "references span the whole list, so encode or decode it serially.")
+    if encoding and contains_type(list_type, SerialisableArray):
+        raise ValueError("Unable to encode a list of SerialisableArray values across workers. "
+                         "Array padding depends on the offset in the whole list, so encode it "
+                         "serially.")
+
+
+def _encode_chunk(list_type: Serialisable, items: list, with_offsets: bool = False) -> tuple:
+    """
+    Encode a chunk of list items in a worker process.
+    :return: tuple: Packed bytes, bit length and the bit offset of every item if requested.
+    """
+    data = StoredData()
+    offsets = []
+    for item in items:
+        if with_offsets:
+            offsets.append(data.bit_length)
+        list_type.serialise_into(data, item)
+    return data.to_bytes(), data.bit_length, offsets
+
+
+def _decode_chunk(list_type: Serialisable, payload: bytes, bit_length: int, count: int) -> list:
+    """
+    Decode a chunk of count list items in a worker process.
+    :return: list: The decoded items.
+    """
+    data = StoredData.from_bytes(payload, bit_length)
+    return [list_type.deseralise(data) for _ in range(count)]
+
+
+def _encode_records_chunk(record_type: Serialisable, values: list) -> list:
+    """
+    Encode a chunk of records in a worker process.
+    :return: list: Packed bytes and bit length of every record.
+    """
+    encoded = []
+    for value in values:
+        data = serialise_record(value, record_type)
+        encoded.append((data.to_bytes(), data.bit_length))
+    return encoded
+
+
+def _map_chunks(function, chunks: list, workers: int, executor) -> list:
+    """
+    Run the function over every chunk in worker processes, keeping the chunk order.
+    Uses the provided executor or a ProcessPoolExecutor of workers processes.
+    """
+    if executor is not None:
+        return list(executor.map(function, *zip(*chunks)))
+    if workers == 1 or len(chunks) <= 1:
+        return [function(*chunk) for chunk in chunks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, *zip(*chunks)))
+
+
+def _chunk_size(length: int, workers: int, chunk_size: int) -> int:
+    if chunk_size is not None:
+        return max(chunk_size, 1)
+    # A few chunks per worker to even out items of different sizes.
+    return max(-(-length // ((workers or os.cpu_count() or 1) * 4)), 1)
+
+
+def encode_parallel(values: list, list_type: Serialisable, max_list_length: int = 1023,
+                    bit_size: int = None, workers: int = None, chunk_size: int = None,
+                    indexed: bool = False, offset_bit_size: int = 32,
+                    executor=None) -> StoredData:
+    """
+    Encode a list across worker processes.
+    The items are split into chunks which are encoded in parallel and then stitched together
+    behind the length prefix, so the result is bit identical to SerialisableList.encode, or
+    to SerialisableIndexedList.encode if indexed is set.
+    List types holding a SerialisableRef or a SerialisableArray are rejected, as back references
+    span chunks and array padding depends on the offset in the whole list.
+    The list type and items must be picklable, so classes must be importable by the workers.
+    :param values: list: The items to encode.
+    :param list_type: Serialisable: The serialisable of the list's items.
+    :param max_list_length: int: The maximum length of the list.
+    :param bit_size: int: Number of bits of the list length. Overrides max_list_length.
+    :param workers: int: Number of worker processes. Defaults to the number of CPUs.
+    :param chunk_size: int: Number of items per chunk. Defaults to 4 chunks per worker.
+    :param indexed: bool: Whether to write the offset table of SerialisableIndexedList.
+    :param offset_bit_size: int: Number of bits of each offset in the index.
+    :param executor: Executor: Existing executor to run the chunks on instead of a new pool.
+    :return: StoredData: The encoded list.
+    """
+    _check_list_type(list_type, True)
+    bit_size = bit_size if bit_size is not None else len(bin(max_list_length)) - 2
+    values = list(values)
+    size = _chunk_size(len(values), workers, chunk_size)
+    chunks = [(list_type, values[start:start + size], indexed)
+              for start in range(0, len(values), size)]
+    results = _map_chunks(_encode_chunk, chunks, workers, executor)
+    data = StoredData()
+    SerialisableInt.encode_into(data, len(values), bit_size)
+    if indexed:
+        chunk_offset = 0
+        for _, chunk_bit_length, offsets in results:
+            for offset in offsets:
+                if (chunk_offset + offset) >> offset_bit_size:
+                    raise ValueError(f"Unable to index list item at bit offset "
+                                     f"{chunk_offset + offset} with {offset_bit_size} bit offsets.")
+                data.add_int(chunk_offset + offset, offset_bit_size)
+            chunk_offset += chunk_bit_length
+    for payload, chunk_bit_length, _ in results:
+        data.add_bytes(payload, chunk_bit_length)
+    return data
+
+
+def decode_parallel(data: StoredData, list_type: Serialisable, max_list_length: int = 1023,
+                    bit_size: int = None, offset_bit_size: int = 32, workers: int = None,
+                    chunk_size: int = None, executor=None) -> list:
+    """
+    Decode an indexed list across worker processes.
+    The offset table of a SerialisableIndexedList is used to cut the items into chunks which are
+    decoded in parallel. As with decode, the pointer is left where it was.
+    List types holding a SerialisableRef are rejected, as their back references span chunks.
+    Arrays decode to the same values, but as copies since each chunk is read into new data.
+    :param data: StoredData: The binary data to read the indexed list from.
+    :param list_type: Serialisable: The serialisable of the list's items.
+    :param max_list_length: int: The maximum length of the list.
+    :param bit_size: int: Number of bits of the list length. Overrides max_list_length.
+    :param offset_bit_size: int: Number of bits of each offset in the index.
+    :param workers: int: Number of worker processes. Defaults to the number of CPUs.
+    :param chunk_size: int: Number of items per chunk. Defaults to 4 chunks per worker.
+    :param executor: Executor: Existing executor to run the chunks on instead of a new pool.
+    :return: list: The decoded items.
+    """
+    _check_list_type(list_type, False)
+    bit_size = bit_size if bit_size is not None else len(bin(max_list_length)) - 2
+    position = data.position
+    list_length = data.read_int_at(position, bit_size)
+    position += bit_size
+    offsets = [data.read_int_at(position + index * offset_bit_size, offset_bit_size)
+               for index in range(list_length)]
+    items_start = position + list_length * offset_bit_size
+    size = _chunk_size(list_length, workers, chunk_size)
+    chunks = []
+    for start in range(0, list_length, size):
+        stop = min(start + size, list_length)
+        if stop < list_length:
+            chunk_bit_length = offsets[stop] - offsets[start]
+        else:  # The end of the last item is unknown, so hand over the rest of the data.
+            chunk_bit_length = data.bit_length - items_start - offsets[start]
+        chunks.append((list_type, data.read_bytes_at(items_start + offsets[start],
+                                                     chunk_bit_length),
+                       chunk_bit_length, stop - start))
+    results = _map_chunks(_decode_chunk, chunks, workers, executor)
+    return [item for items in results for item in items]
+
+
+def encode_records_parallel(values: list, record_type: Serialisable = None,
+                            workers: int = None, chunk_size: int = None,
+                            executor=None) -> list:
+    """
+    Encode a batch of records across worker processes.
+    The results can be written in order with RecordWriter.write_data.
+    :param values: list: The records to encode.
+    :param record_type: Serialisable: Serialisable instance or class to encode the records with.
+    :param workers: int: Number of worker processes. Defaults to the number of CPUs.
+    :param chunk_size: int: Number of records per chunk. Defaults to 4 chunks per worker.
+    :param executor: Executor: Existing executor to run the chunks on instead of a new pool.
+    :return: list: StoredData of every record.
+    """
+    values = list(values)
+    size = _chunk_size(len(values), workers, chunk_size)
+    chunks = [(record_type, values[start:start + size]) for start in range(0, len(values), size)]
+    results = _map_chunks(_encode_records_chunk, chunks, workers, executor)
+    return [StoredData.from_bytes(payload, bit_length)
+            for encoded in results for payload, bit_length in encoded]
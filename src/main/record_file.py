@@ -0,0 +1,226 @@
+import mmap
+import os
+import struct
+
+from src.main import StoredData
+from src.main.types import ObjectCodec
+
+RECORD_FILE_HEADER = struct.Struct(">4sBIQH")  # Magic, version, record bits, count, name length.
+RECORD_FILE_MAGIC = b"RFIL"
+COUNT_OFFSET = 9  # Byte offset of the record count in the header.
+MODES = ("r", "r+", "w")
+
+
+class RecordFile:
+    """
+    Table of fixed width serialisable objects stored in a file and accessed through mmap.
+    The file starts with a header holding the class name, the version of the class's version map
+    and the number of records, followed by the records back to back. Each record holds the
+    fields of the version with no version prefix, padded to whole bytes, so record i is found at
+    a fixed stride from the start without an index or a scan.
+    Only classes whose version map has nothing but fixed width fields can be stored.
+    Records can be read by index or slice, updated in place and appended. Reading decodes into
+    new objects, so changing a decoded object does not change the file until it is assigned
+    back.
+    """
+
+    def __init__(self, file, class_type: type, mode: str = "r", version: int = None) -> None:
+        """
+        Open or create the record file.
+        :param file: Path of the record file.
+        :param class_type: type: SerialisableObject subclass of the records.
+        :param mode: str: "r" to read, "r+" to read and write an existing file or "w" to create
+            a new empty file.
+        :param version: int: Version of the version map to create a file with. Defaults to the
+            class's __VERSION__. Existing files use the version in their header.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Invalid record file mode {mode}. Expected one of {MODES}.")
+        self.class_type = class_type
+        self.writable = mode != "r"
+        if mode == "w":
+            self.version = class_type.__VERSION__ if version is None else version
+            self._compile()  # Check the class can be stored before truncating the file.
+        self._file = open(file, {"r": "rb", "r+": "r+b", "w": "w+b"}[mode])
+        self._mmap = None
+        try:
+            if mode == "w":
+                self._write_header()
+            else:
+                self._read_header()
+            self._map()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _compile(self) -> None:
+        self.codec = ObjectCodec.get(self.class_type, self.version)
+        if self.codec is None:
+            raise ValueError(f"Unable to store {self.class_type.__qualname__} records. Version "
+                             f"{self.version} is not in its version map.")
+        self.record_bits = self.codec.bit_size
+        if not self.record_bits:
+            raise ValueError(f"Unable to store {self.class_type.__qualname__} records. Every "
+                             f"field of version {self.version} must have a fixed bit size.")
+        self.record_size = (self.record_bits + 7) >> 3
+
+    def _write_header(self) -> None:
+        name = self.class_type.__qualname__.encode("utf-8")
+        self._file.write(RECORD_FILE_HEADER.pack(RECORD_FILE_MAGIC, self.version,
+                                                 self.record_bits, 0, len(name)) + name)
+        self._file.flush()
+        self._start = RECORD_FILE_HEADER.size + len(name)
+        self._count = 0
+
+    def _read_header(self) -> None:
+        header = self._file.read(RECORD_FILE_HEADER.size)
+        if len(header) < RECORD_FILE_HEADER.size:
+            raise ValueError("Unable to open record file. The file is shorter than its header.")
+        magic, self.version, record_bits, self._count, name_length = \
+            RECORD_FILE_HEADER.unpack(header)
+        if magic != RECORD_FILE_MAGIC:
+            raise ValueError("Unable to open record file. The file has no record file header.")
+        name = self._file.read(name_length).decode("utf-8")
+        if name != self.class_type.__qualname__:
+            raise ValueError(f"Unable to open record file of {name} records as "
+                             f"{self.class_type.__qualname__}.")
+        self._compile()
+        if record_bits != self.record_bits:
+            raise ValueError(f"Unable to open record file. Its records are {record_bits} bits "
+                             f"but version {self.version} of {name} is {self.record_bits} bits.")
+        self._start = RECORD_FILE_HEADER.size + name_length
+        size = os.fstat(self._file.fileno()).st_size
+        if self._start + self._count * self.record_size > size:
+            raise ValueError(f"Unable to open record file. The file is too short to hold "
+                             f"{self._count} records.")
+
+    def _map(self) -> None:
+        """
+        Map the file, replacing any previous mapping.
+        :return: None
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Record index {index} out of range for a file of {self._count} "
+                             f"records.")
+        return self._start + index * self.record_size
+
+    def _decode(self, data: StoredData, offset: int) -> object:
+        obj = self.class_type()
+        self.codec.decode_at(obj, data, offset)
+        return obj
+
+    def _encode(self, value: object) -> bytes:
+        data = StoredData()
+        self.codec.encode_into(data, value)
+        return data.to_bytes()
+
+    def read_range(self, start: int, stop: int) -> list:
+        """
+        Read a contiguous range of records with a single copy from the mapped file.
+        :param start: int: Index of the first record.
+        :param stop: int: Index after the last record.
+        :return: list: The decoded records.
+        """
+        start, stop, _ = slice(start, stop).indices(self._count)
+        if stop <= start:
+            return []
+        position = self._start + start * self.record_size
+        byte_size = (stop - start) * self.record_size
+        data = StoredData.from_bytes(self._mmap[position:position + byte_size], byte_size * 8)
+        stride = self.record_size * 8
+        return [self._decode(data, index * stride) for index in range(stop - start)]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1:
+                return self.read_range(start, stop)
+            return [self[position] for position in range(start, stop, step)]
+        position = self._position(index)
+        data = StoredData.from_bytes(self._mmap[position:position + self.record_size],
+                                     self.record_size * 8)
+        return self._decode(data, 0)
+
+    def __setitem__(self, index, value) -> None:
+        if not self.writable:
+            raise AttributeError("Unable to update records of a read only record file.")
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._count))
+            values = list(value)
+            if len(values) != len(positions):
+                raise ValueError(f"Unable to assign {len(values)} records to a slice of "
+                                 f"{len(positions)} records.")
+            for position, item in zip(positions, values):
+                self[position] = item
+            return
+        position = self._position(index)
+        self._mmap[position:position + self.record_size] = self._encode(value)
+
+    def __iter__(self):
+        chunk = max((1 << 20) // self.record_size, 1)  # About a megabyte of records at a time.
+        for start in range(0, self._count, chunk):
+            yield from self.read_range(start, start + chunk)
+
+    def append(self, value: object) -> None:
+        """
+        Append a record to the end of the file.
+        :param value: object: The record to append.
+        :return: None
+        """
+        self.extend([value])
+
+    def extend(self, values) -> None:
+        """
+        Append records to the end of the file with a single write.
+        :param values: Iterable of the records to append.
+        :return: None
+        """
+        if not self.writable:
+            raise AttributeError("Unable to append records to a read only record file.")
+        encoded = [self._encode(value) for value in values]
+        if not encoded:
+            return
+        self._file.seek(self._start + self._count * self.record_size)
+        self._file.write(b"".join(encoded))
+        self._count += len(encoded)
+        self._file.seek(COUNT_OFFSET)
+        self._file.write(struct.pack(">Q", self._count))
+        self._file.flush()
+        self._map()  # The mapping does not grow with the file.
+
+    def flush(self) -> None:
+        """
+        Write in place updates back to the file.
+        :return: None
+        """
+        if self.writable:
+            self._mmap.flush()
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush and close the record file.
+        :return: None
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,365 @@
+import io
+import struct
+from bisect import bisect_left
+
+from src.main import Serialisable, StoredData
+from src.main.compression import compress, compression_id, decompress
+
+FRAME_HEADER = struct.Struct(">I")
+INDEX_MARKER = 0xFFFFFFFF  # Frame header value marking the start of the index footer.
+BLOCK_MARKER = 0xFFFFFFFE  # Frame header value marking a compressed block of records.
+BLOCK_HEADER = struct.Struct(">I")  # Compressed block byte length.
+INDEX_OFFSET = struct.Struct(">Q")
+INDEX_TRAILER = struct.Struct(">QQ4s")  # Record count, records byte length, magic.
+INDEX_MAGIC = b"RIDX"
+
+
+def serialise_record(value: object, record_type: Serialisable = None) -> StoredData:
+    """
+    Serialise a single record.
+    :param value: object: The value to serialise.
+    :param record_type: Serialisable: Serialisable instance or class to encode the value with.
+        Defaults to the value itself when it is a Serialisable.
+    :return: StoredData: The encoded record.
+    """
+    if record_type is None:
+        if not isinstance(value, Serialisable):
+            raise ValueError(f"Unable to serialise record {value}. Provide a record type for "
+                             f"values that are not serialisable.")
+        return value.serialise()
+    if isinstance(record_type, type):
+        return record_type.encode(value)
+    return record_type.serialise(value)
+
+
+def deserialise_record(data: StoredData, record_type: Serialisable) -> object:
+    """
+    Deserialise a single record.
+    :param data: StoredData: The encoded record.
+    :param record_type: Serialisable: Serialisable instance or class to decode the record with.
+    :return: object: The decoded record.
+    """
+    if isinstance(record_type, type):
+        return record_type.decode(data)
+    return record_type.deseralise(data)
+
+
+def read_exact(fileobj, size: int) -> bytes:
+    """
+    Read exactly size bytes from a binary stream, retrying short reads.
+    :param fileobj: Binary file like object.
+    :param size: int: The number of bytes to read.
+    :return: bytes: The bytes read. Shorter than size only if the stream ended.
+    """
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = fileobj.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def frame(data: StoredData) -> bytes:
+    """
+    Frame the packed bytes of the stored data with its bit length.
+    :param data: StoredData: The encoded record.
+    :return: bytes: The framed record.
+    """
+    return FRAME_HEADER.pack(data.bit_length) + data.to_bytes()
+
+
+class RecordWriter:
+    """
+    Writes framed records to a binary stream.
+    Each record is written as a 4 byte big endian bit length followed by the packed bytes of the
+    record, so only one record is held in memory at a time.
+    If index is set, closing the writer appends a footer holding the byte offset of every
+    record, which IndexedRecordReader uses to seek straight to any record.
+    If compression is set, framed records are collected into blocks of about block_size bytes
+    which are compressed and written behind a block marker. The index then holds the offset of
+    each record's block, so random access only decompresses the one block.
+    """
+
+    def __init__(self, fileobj, record_type: Serialisable = None, index: bool = False,
+                 compression=None, block_size: int = 65536) -> None:
+        """
+        Initialise the record writer.
+        :param fileobj: Binary file like object to write the records to.
+        :param record_type: Serialisable: Default serialisable instance or class of the records.
+        :param index: bool: Whether to write an offset index footer when closed.
+        :param compression: str or int: Name or id of a registered compression codec to
+            compress blocks of records with. Default uncompressed.
+        :param block_size: int: Framed bytes of records collected before a block is compressed.
+        """
+        self._fileobj = fileobj
+        self.record_type = record_type
+        self.records = 0
+        self.index = index
+        self.compression = compression_id(compression) if compression is not None else None
+        self.block_size = block_size
+        self._block = []
+        self._block_length = 0
+        self._offsets = []
+        self._position = 0  # Bytes written since the writer was created.
+        self._closed = False
+
+    def write(self, value: object, record_type: Serialisable = None) -> int:
+        """
+        Serialise and write a record.
+        :param value: object: The value to write.
+        :param record_type: Serialisable: Serialisable to encode the value with. Defaults to the
+            writer's record type.
+        :return: int: The number of bytes written.
+        """
+        record_type = record_type if record_type is not None else self.record_type
+        return self.write_data(serialise_record(value, record_type))
+
+    def write_data(self, data: StoredData) -> int:
+        """
+        Write already encoded data as a record.
+        :param data: StoredData: The encoded record.
+        :return: int: The number of bytes written.
+        """
+        if self._closed:
+            raise ValueError("Unable to write a record to a closed record writer.")
+        if data.bit_length >= BLOCK_MARKER:
+            raise ValueError(f"Unable to frame a record of {data.bit_length} bits.")
+        framed = frame(data)
+        if self.index:
+            self._offsets.append(self._position)
+        self.records += 1
+        if self.compression is None:
+            self._fileobj.write(framed)
+            self._position += len(framed)
+            return len(framed)
+        self._block.append(framed)
+        self._block_length += len(framed)
+        if self._block_length >= self.block_size:
+            self._write_block()
+        return len(framed)
+
+    def _write_block(self) -> None:
+        """
+        Compress and write the collected block of records.
+        :return: None
+        """
+        if not self._block:
+            return
+        raw = b"".join(self._block)
+        compressed = compress(raw, len(raw) * 8, self.compression)
+        block = FRAME_HEADER.pack(BLOCK_MARKER) + BLOCK_HEADER.pack(len(compressed)) + compressed
+        self._fileobj.write(block)
+        self._position += len(block)
+        self._block = []
+        self._block_length = 0
+
+    def flush(self) -> None:
+        """
+        Write any collected block of records and flush the file object.
+        :return: None
+        """
+        self._write_block()
+        self._fileobj.flush()
+
+    def close(self) -> None:
+        """
+        Write the index footer if enabled and flush. The file object is left open.
+        :return: None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._write_block()
+        if self.index:
+            footer = [FRAME_HEADER.pack(INDEX_MARKER)]
+            footer.extend(INDEX_OFFSET.pack(offset) for offset in self._offsets)
+            footer.append(INDEX_TRAILER.pack(len(self._offsets), self._position, INDEX_MAGIC))
+            self._fileobj.write(b"".join(footer))
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class RecordReader:
+    """
+    Reads framed records written by a RecordWriter from a binary stream.
+    Only the record currently being decoded is buffered, or the block holding it if the records
+    were compressed.
+    """
+
+    def __init__(self, fileobj, record_type: Serialisable = None, max_record_size: int = None):
+        """
+        Initialise the record reader.
+        :param fileobj: Binary file like object to read the records from.
+        :param record_type: Serialisable: Serialisable instance or class of the records.
+        :param max_record_size: int: Largest record in bytes that will be read. Default no limit.
+        """
+        self._fileobj = fileobj
+        self.record_type = record_type
+        self.max_record_size = max_record_size
+        self._block = None  # Stream over the decompressed block being read.
+
+    def read_data(self) -> StoredData:
+        """
+        Read the next record's encoded data.
+        :return: StoredData: The encoded record or None at the end of the stream.
+        """
+        while True:
+            if self._block is not None:
+                data = self._read_frame(self._block)
+                if data is not None:
+                    return data
+                self._block = None
+            data = self._read_frame(self._fileobj)
+            if data is not BLOCK_MARKER:
+                return data
+            self._block = io.BytesIO(self._read_block())
+
+    def _read_frame(self, stream):
+        """
+        Read the next framed record of the stream.
+        :param stream: Binary file like object positioned at a frame header.
+        :return: StoredData: The encoded record, None at the end of the records or BLOCK_MARKER
+            if a compressed block follows.
+        """
+        header = read_exact(stream, FRAME_HEADER.size)
+        if not header:
+            return None
+        if len(header) < FRAME_HEADER.size:
+            raise ValueError("Unable to read record. The stream ended inside a record header.")
+        bit_length, = FRAME_HEADER.unpack(header)
+        if bit_length == INDEX_MARKER:
+            return None  # Reached the index footer.
+        if bit_length == BLOCK_MARKER:
+            return BLOCK_MARKER
+        byte_length = (bit_length + 7) >> 3
+        if self.max_record_size is not None and byte_length > self.max_record_size:
+            raise ValueError(f"Unable to read record of {byte_length} bytes. Records are limited "
+                             f"to {self.max_record_size} bytes.")
+        payload = read_exact(stream, byte_length)
+        if len(payload) < byte_length:
+            raise ValueError("Unable to read record. The stream ended inside a record.")
+        return StoredData.from_bytes(payload, bit_length)
+
+    def _read_block(self) -> bytes:
+        """
+        Read and decompress the block following a block marker.
+        :return: bytes: The framed records of the block.
+        """
+        header = read_exact(self._fileobj, BLOCK_HEADER.size)
+        if len(header) < BLOCK_HEADER.size:
+            raise ValueError("Unable to read block. The stream ended inside a block header.")
+        block_length, = BLOCK_HEADER.unpack(header)
+        compressed = read_exact(self._fileobj, block_length)
+        if len(compressed) < block_length:
+            raise ValueError("Unable to read block. The stream ended inside a block.")
+        raw, _ = decompress(compressed)
+        return raw
+
+    def read(self) -> object:
+        """
+        Read and decode the next record.
+        :return: object: The decoded record or None at the end of the stream.
+        """
+        data = self.read_data()
+        if data is None:
+            return None
+        return deserialise_record(data, self.record_type)
+
+    def __iter__(self):
+        while True:
+            data = self.read_data()
+            if data is None:
+                return
+            yield deserialise_record(data, self.record_type)
+
+
+class IndexedRecordReader(RecordReader):
+    """
+    Random access reader for record files written by a RecordWriter with index set.
+    The offset index footer is loaded once, after which any record or slice of records is read
+    with a single seek per record. Records of compressed files share the offset of their block,
+    and the last block read is kept decompressed.
+    """
+
+    def __init__(self, fileobj, record_type: Serialisable = None, max_record_size: int = None):
+        """
+        Initialise the indexed record reader and load the index footer.
+        :param fileobj: Seekable binary file like object to read the records from.
+        :param record_type: Serialisable: Serialisable instance or class of the records.
+        :param max_record_size: int: Largest record in bytes that will be read. Default no limit.
+        """
+        super().__init__(fileobj, record_type, max_record_size)
+        fileobj.seek(-INDEX_TRAILER.size, 2)
+        count, records_length, magic = INDEX_TRAILER.unpack(read_exact(fileobj,
+                                                                       INDEX_TRAILER.size))
+        if magic != INDEX_MAGIC:
+            raise ValueError("Unable to read record index. The stream has no index footer.")
+        table_length = count * INDEX_OFFSET.size
+        table_start = fileobj.seek(-INDEX_TRAILER.size - table_length, 2)
+        self._start = table_start - FRAME_HEADER.size - records_length
+        table = read_exact(fileobj, table_length)
+        self._offsets = [offset for offset, in INDEX_OFFSET.iter_unpack(table)]
+        self._block_offset = None
+        self._block_data = None
+        fileobj.seek(self._start)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def read_data_at(self, index: int) -> StoredData:
+        """
+        Read a record's encoded data.
+        :param index: int: The record number.
+        :return: StoredData: The encoded record.
+        """
+        offset = self._offsets[index]
+        if offset == self._block_offset:
+            return self._read_block_record(index)
+        self._fileobj.seek(self._start + offset)
+        self._block = None
+        data = self._read_frame(self._fileobj)
+        if data is not BLOCK_MARKER:
+            return data
+        self._block_offset = offset
+        self._block_data = self._read_block()
+        return self._read_block_record(index)
+
+    def _read_block_record(self, index: int) -> StoredData:
+        """
+        Read a record from the decompressed block it is in.
+        Records of a block are in order, so its position in the block follows from the index
+        of the block's first record.
+        :return: StoredData: The encoded record.
+        """
+        index = index if index >= 0 else index + len(self._offsets)
+        block = io.BytesIO(self._block_data)
+        for _ in range(index - bisect_left(self._offsets, self._offsets[index])):
+            header = block.read(FRAME_HEADER.size)
+            bit_length, = FRAME_HEADER.unpack(header)
+            block.seek((bit_length + 7) >> 3, 1)
+        return self._read_frame(block)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [deserialise_record(self.read_data_at(position), self.record_type)
+                    for position in range(*index.indices(len(self._offsets)))]
+        return deserialise_record(self.read_data_at(index), self.record_type)
+
+
+def iter_decode(fileobj, record_type: Serialisable, max_record_size: int = None):
+    """
+    Lazily decode every record of a binary stream written by a RecordWriter.
+    :param fileobj: Binary file like object to read the records from.
+    :param record_type: Serialisable: Serialisable instance or class of the records.
+    :param max_record_size: int: Largest record in bytes that will be read. Default no limit.
+    :return: Generator of the decoded records.
+    """
+    return iter(RecordReader(fileobj, record_type, max_record_size))
@@ -1,10 +1,67 @@
-from src.main import StoredData
+from contextvars import ContextVar
+
+from src.main import StoredData, instrumentation
+
+_scope = ContextVar("serialisable_scope", default=None)
+
+
+def message_scope() -> dict:
+    """
+    Get the scope of the top level encode or decode running in this context.
+    Serialisables nested in one message can keep state for the rest of the message in the scope,
+    such as the back reference tables of SerialisableRef. A new scope is started by every top
+    level encode_into, decode and decode_at and dropped when it returns.
+    :return: dict: The scope or None outside of an encode or decode.
+    """
+    return _scope.get()
+
+
+def _in_scope(function, *args, **kwargs):
+    """
+    Run the function in a new message scope.
+    """
+    token = _scope.set({})
+    try:
+        return function(*args, **kwargs)
+    finally:
+        _scope.reset(token)
+
+
+def contains_type(serialisable, types, seen: set = None) -> bool:
+    """
+    Check whether the serialisable or any serialisable nested in it is one of the types.
+    Follows the list, length and value types of containers and the fields of every version of
+    serialisable objects.
+    :param serialisable: Serialisable instance or class to check.
+    :param types: type or tuple of types to look for.
+    :param seen: set: Ids of the serialisables already checked.
+    :return: bool
+    """
+    seen = set() if seen is None else seen
+    if serialisable is None or id(serialisable) in seen:
+        return False
+    seen.add(id(serialisable))
+    if isinstance(serialisable, types) or (isinstance(serialisable, type)
+                                           and issubclass(serialisable, types)):
+        return True
+    for name in ("list_type", "length_type", "value_type"):
+        if contains_type(getattr(serialisable, name, None), types, seen):
+            return True
+    version_map = getattr(serialisable, "version_map", None)
+    if isinstance(version_map, dict):
+        for fields in version_map.values():
+            for field in fields:
+                if contains_type(getattr(field, "serialisable", None), types, seen):
+                    return True
+    return False
 
 
 class Serialisable:
     """
     Serialisable parent class.
-    All child classes should implement the _encode and _decode methods for encoding.
+    All child classes should implement the _encode_into and _decode_at methods for encoding.
+    Decoding passes explicit bit offsets around instead of moving the stored data's pointer.
+    decode and deseralise wrap _decode_at to keep their peek and consume pointer behaviour.
     the serialise and deserialise methods should be overridden too to accompany different
     variables for serialisable objects.
     """
@@ -27,6 +84,17 @@ class Serialisable:
         """
         return self.encode(self if other is None else other, *args, **kwargs)
 
+    def serialise_into(self, data: StoredData, other: object = None, *args, **kwargs) -> StoredData:
+        """
+        Serialise this class into the end of the provided stored data.
+        :param data: StoredData: The data to append the serialised class object to.
+        :param other: object: A different value or object to encode instead of self.
+        :param args: List of arguments to pass to the encoder.
+        :param kwargs: List of keyword arguments to pass to the encoder.
+        :return: StoredData: The provided data.
+        """
+        return self.encode_into(data, self if other is None else other, *args, **kwargs)
+
     def deseralise(self, data: StoredData, *args, **kwargs) -> object:
         """
         Deserialise the provided stored data into this class.
@@ -36,11 +104,48 @@ class Serialisable:
         :param kwargs: List of key word arguments to pass to decoder
         :return: object: This class with variables set from the stored data.
         """
-        data.record_pointer()
-        value = self.decode(data, *args, **kwargs)
-        data.update_pointer()
+        start = data.position
+        value, end = self.decode_at(data, start, *args, **kwargs)
+        data.skip_bits(end - start)
         return value
 
+    def deseralise_at(self, data: StoredData, offset: int, *args, **kwargs) -> (object, int):
+        """
+        Deserialise this class from an explicit bit offset of the provided stored data.
+        The stored data's pointer is not used or moved.
+        :param data: StoredData: The data to read this class's information from.
+        :param offset: int: The bit offset to read from.
+        :param args: List of arguments to pass to decoder
+        :param kwargs: List of key word arguments to pass to decoder
+        :return: (object, int): The decoded value and the bit offset following it.
+        """
+        return self.decode_at(data, offset, *args, **kwargs)
+
+    def fixed_bit_size(self) -> int:
+        """
+        The number of bits this serialisable always encodes to, if the width is fixed.
+        Serialisables with a fixed width can be fused with their neighbours by compiled codecs
+        and must implement pack and unpack.
+        :return: int: The fixed number of bits or None if the encoded width varies.
+        """
+        return None
+
+    def pack(self, value: object) -> int:
+        """
+        Pack the value into an integer holding exactly fixed_bit_size bits.
+        :param value: object: The value to pack.
+        :return: int: The encoded bits of the value.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not have a fixed bit size.")
+
+    def unpack(self, bits: int) -> object:
+        """
+        Unpack a value from an integer holding exactly fixed_bit_size bits.
+        :param bits: int: The encoded bits of the value.
+        :return: object: The decoded value.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not have a fixed bit size.")
+
     @classmethod
     def encode(cls, value: object, *args, **kwargs) -> StoredData:
         """
@@ -50,12 +155,43 @@ class Serialisable:
         :param kwargs: Keyword arguments to help the encoder encode this.
         :return: StoredData: Binary data of the provided value.
         """
-        return cls._encode(value, *args, **kwargs)
+        return cls.encode_into(StoredData(), value, *args, **kwargs)
+
+    @classmethod
+    def encode_into(cls, data: StoredData, value: object, *args, **kwargs) -> StoredData:
+        """
+        Class Method to encode the provided object onto the end of existing stored data.
+        Nested encoders write into the same stored data instead of creating their own.
+        :param data: StoredData: The data to append the encoded value to.
+        :param value: object: Encodes this object into the provided stored data.
+        :param args: Arguments to help the encoder encode this.
+        :param kwargs: Keyword arguments to help the encoder encode this.
+        :return: StoredData: The provided data.
+        """
+        if _scope.get() is None:
+            return _in_scope(cls.encode_into, data, value, *args, **kwargs)
+        if instrumentation.profiler is not None:
+            return instrumentation.profiler.encode_into(cls, data, value, args, kwargs)
+        cls._encode_into(data, value, *args, **kwargs)
+        return data
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: object, *args, **kwargs) -> None:
+        """
+        Children should implement this method to write their encoded value into the data.
+        Defaults to appending the result of _encode for children that only implement _encode.
+        :param data: StoredData: The data to append the encoded value to.
+        :param value: object: The object to encode into binary data.
+        :param args: Arguments to help the encoder encode this.
+        :param kwargs: Keyword arguments to help the encoder encode this
+        :return: None
+        """
+        data += cls._encode(value, *args, **kwargs)
 
     @classmethod
     def _encode(cls, value: object, *args, **kwargs) -> StoredData:
         """
-        Children must implement this method to correctly encode their classes.
+        Encode the value into new stored data. Superseded by _encode_into.
         :param value: object: The object to encode into binary data.
         :param args: Arguments to help the encoder encode this.
         :param kwargs: Keyword arguments to help the encoder encode this
@@ -75,15 +211,51 @@ class Serialisable:
         :param kwargs: List of key word arguments to pass to decoder
         :return: object: Serialisable object that is decoded.
         """
-        data.record_pointer()
-        result = cls._decode(data, *args, **kwargs)
-        data.reset_pointer()
-        return result
+        if _scope.get() is None:
+            return _in_scope(cls.decode, data, *args, **kwargs)
+        if instrumentation.profiler is not None:
+            value, _ = instrumentation.profiler.decode_at(cls, data, data.position, args, kwargs)
+            return value
+        value, _ = cls._decode_at(data, data.position, *args, **kwargs)
+        return value
+
+    @classmethod
+    def decode_at(cls, data: StoredData, offset: int, *args, **kwargs) -> (object, int):
+        """
+        Decode the provided data from an explicit bit offset into a new object of this class.
+        The stored data's pointer is not used or moved.
+        :param data: StoredData: The binary data to read and decode from.
+        :param offset: int: The bit offset to read from.
+        :param args: List of arguments to pass to decoder
+        :param kwargs: List of key word arguments to pass to decoder
+        :return: (object, int): The decoded object and the bit offset following it.
+        """
+        if _scope.get() is None:
+            return _in_scope(cls.decode_at, data, offset, *args, **kwargs)
+        if instrumentation.profiler is not None:
+            return instrumentation.profiler.decode_at(cls, data, offset, args, kwargs)
+        return cls._decode_at(data, offset, *args, **kwargs)
+
+    @classmethod
+    def _decode_at(cls, data: StoredData, offset: int, *args, **kwargs) -> (object, int):
+        """
+        Children should implement this method to decode their value at the bit offset.
+        Defaults to running _decode on an independent reader for children that only implement
+        _decode.
+        :param data: StoredData: The data to read this class's information from.
+        :param offset: int: The bit offset to read from.
+        :param args: List of arguments to pass to decoder
+        :param kwargs: List of key word arguments to pass to decoder
+        :return: (object, int): The decoded object and the bit offset following it.
+        """
+        reader = data.reader(offset)
+        value = cls._decode(reader, *args, **kwargs)
+        return value, reader.position
 
     @classmethod
     def _decode(cls, data: StoredData, *args, **kwargs) -> object:
         """
-        The decode method to be implemented by subclasses.
+        Pointer based decode method. Superseded by _decode_at.
         :param data: StoredData: The data to read this class's information from.
         :param args: List of arguments to pass to decoder
         :param kwargs: List of key word arguments to pass to decoder
@@ -19,15 +19,20 @@ class SerialiseData:
         if not hasattr(parent, self.property_name):
             raise ValueError(f"Unable to instantiate serialisable object. Parent does not has specified property. \
                              property: {self.property_name}. class: {parent}")
-        return self.serialisable.encode(getattr(parent, self.property_name))
+        return self.serialisable.serialise(getattr(parent, self.property_name))
+
+    def get_into(self, parent: object, data: StoredData) -> StoredData:
+        """ Appends the serialised value of the parent and property value to the data."""
+        if not hasattr(parent, self.property_name):
+            raise ValueError(f"Unable to instantiate serialisable object. Parent does not has specified property. \
+                             property: {self.property_name}. class: {parent}")
+        return self.serialisable.serialise_into(data, getattr(parent, self.property_name))
 
     def set(self, parent: object, data: StoredData) -> None:
         """ Set the parent property value based on the decoded data. Updates pointer."""
         if not hasattr(parent, self.property_name):
             raise ValueError(f"Unable to instantiate serialisable object. Parent does not has specified property. \
                              property: {self.property_name}. class: {parent}")
-        data.record_pointer()
-        value = self.serialisable.decode(data)
-        data.update_pointer()
+        value = self.serialisable.deseralise(data)
         setattr(parent, self.property_name, value)
 
@@ -1,5 +1,13 @@
 from .serialisable_value import SerialisableValue
 from .serialisable_int import SerialisableInt
+from .serialisable_var_int import SerialisableVarInt
 from .serialisable_string import SerialisableString
+from .serialisable_var_string import SerialisableVarString
 from .serialisable_list import SerialisableList
+from .serialisable_indexed_list import SerialisableIndexedList
+from .serialisable_ref import RefStats, RefTable, SerialisableRef
+from .serialisable_array import SerialisableArray
+from .object_codec import ObjectCodec
+from .lazy_object import LazyObject
+from .tracked_object import EncodedCache, TrackedObject
 from .serialisable_object import SerialisableObject
@@ -0,0 +1,135 @@
+from src.main import StoredData
+
+
+class LazyState:
+    """
+    Decoding state of a lazily decoded serialisable object.
+    Tracks the bit offset of every step of the object's codec. Offsets after fixed width steps
+    are known up front, offsets after variable width steps become known once that step has been
+    decoded.
+    """
+
+    def __init__(self, data: StoredData, offset: int, codec) -> None:
+        """
+        Initialise the lazy state.
+        :param data: StoredData: The data the object was encoded in.
+        :param offset: int: The bit offset of the object's first field.
+        :param codec: ObjectCodec: The compiled codec of the object's class and version.
+        """
+        self.data = data
+        self.codec = codec
+        self.offsets = [offset] + [None] * len(codec.steps)
+        self.loaded = [False] * len(codec.steps)
+        self._propagate(0)
+
+    def copy(self) -> "LazyState":
+        """
+        Copy the state for a copy of the lazy object, sharing the stored data and codec.
+        :return: LazyState
+        """
+        state = LazyState.__new__(LazyState)
+        state.data = self.data
+        state.codec = self.codec
+        state.offsets = list(self.offsets)
+        state.loaded = list(self.loaded)
+        return state
+
+    def _propagate(self, index: int) -> None:
+        """
+        Fill in the offsets following a known offset through fixed width steps.
+        :param index: int: Index of the step whose start offset is known.
+        :return: None
+        """
+        steps = self.codec.steps
+        while index < len(steps) and steps[index].bit_size is not None:
+            if self.offsets[index + 1] is None:
+                self.offsets[index + 1] = self.offsets[index] + steps[index].bit_size
+            index += 1
+
+    def load(self, obj: object, step_index: int) -> None:
+        """
+        Decode a step onto the object, decoding any variable width steps before it whose width
+        is needed to find the step's offset.
+        :param obj: object: The lazy object.
+        :param step_index: int: The index of the step to decode.
+        :return: None
+        """
+        for index in range(step_index):
+            if self.offsets[index + 1] is None:
+                self._decode_step(obj, index)
+        if not self.loaded[step_index]:
+            self._decode_step(obj, step_index)
+
+    def load_all(self, obj: object) -> None:
+        for index in range(len(self.codec.steps)):
+            if not self.loaded[index]:
+                self._decode_step(obj, index)
+
+    def _decode_step(self, obj: object, index: int) -> None:
+        step = self.codec.steps[index]
+        assigned = {property_name: obj.__dict__[property_name]
+                    for property_name in step.property_names if property_name in obj.__dict__}
+        end = step.decode_at(obj, self.data, self.offsets[index])
+        obj.__dict__.update(assigned)  # Keep fields assigned before they were decoded.
+        self.loaded[index] = True
+        if self.offsets[index + 1] is None:
+            self.offsets[index + 1] = end
+            self._propagate(index + 1)
+
+
+class LazyObject:
+    """
+    Mixin for lazily decoded serialisable objects.
+    Lazy objects are instances of a generated subclass of the decoded class, so they behave as
+    the decoded class. The fields from the version map are removed after initialisation and
+    are decoded on first access by __getattr__, after which they are plain attributes.
+    The stored data must not be changed while the lazy object still has fields to decode.
+    """
+
+    _lazy_classes = {}
+
+    @classmethod
+    def create(cls, class_type: type, data: StoredData, offset: int, codec) -> object:
+        """
+        Create a lazy object of the class.
+        :param class_type: type: SerialisableObject subclass to decode.
+        :param data: StoredData: The data the object was encoded in.
+        :param offset: int: The bit offset of the object's first field.
+        :param codec: ObjectCodec: The compiled codec of the class and encoded version.
+        :return: object: Lazy instance of the class.
+        """
+        lazy_type = cls._lazy_classes.get(class_type)
+        if lazy_type is None:
+            lazy_type = type(f"Lazy{class_type.__name__}", (cls, class_type), {})
+            cls._lazy_classes[class_type] = lazy_type
+        obj = lazy_type()
+        for property_name in codec.field_steps:
+            obj.__dict__.pop(property_name, None)
+        obj.__dict__["_lazy_state"] = LazyState(data, offset, codec)
+        return obj
+
+    def load_all(self) -> object:
+        """
+        Decode every field that has not been accessed yet.
+        :return: object: self
+        """
+        self.__dict__["_lazy_state"].load_all(self)
+        return self
+
+    def __copy__(self) -> object:
+        obj = type(self).__new__(type(self))
+        obj.__dict__.update(self.__dict__)
+        state = self.__dict__.get("_lazy_state")
+        if state is not None:  # Fields loaded later by either object must not skip the other.
+            obj.__dict__["_lazy_state"] = state.copy()
+        return obj
+
+    def __getattr__(self, name: str) -> object:
+        state = self.__dict__.get("_lazy_state")
+        if state is None or name not in state.codec.field_steps:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        step_index = state.codec.field_steps[name]
+        if state.loaded[step_index]:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        state.load(self, step_index)
+        return self.__dict__[name]
@@ -0,0 +1,182 @@
+from src.main import StoredData, instrumentation
+from src.main.serialise_data import SerialiseData
+
+
+class FixedFieldGroup:
+    """
+    Run of adjacent fixed width fields of a serialisable object.
+    The fields are packed into one integer and written or read with a single call to the
+    stored data.
+    """
+
+    def __init__(self, fields: list) -> None:
+        """
+        Initialise the fixed field group.
+        :param fields: list: Ordered list of SerialiseData whose serialisables have a fixed width.
+        """
+        self.bit_size = 0
+        self.property_names = []
+        encoders = []
+        decoders = []
+        for serialise_data in fields:
+            width = serialise_data.serialisable.fixed_bit_size()
+            self.bit_size += width
+            self.property_names.append(serialise_data.property_name)
+            encoders.append((serialise_data.property_name, serialise_data.serialisable.pack, width))
+            decoders.append((serialise_data.property_name, serialise_data.serialisable.unpack,
+                             width, (1 << width) - 1))
+        shift = self.bit_size
+        self._encoders = tuple(encoders)
+        self._decoders = []
+        for property_name, unpack, width, mask in decoders:
+            shift -= width
+            self._decoders.append((property_name, unpack, shift, mask))
+        self._decoders = tuple(self._decoders)
+
+    def pack(self, value: object) -> int:
+        """
+        Pack the group's fields of the value into one integer.
+        :param value: object: The object holding the fields.
+        :return: int: The group's encoded bits.
+        """
+        bits = 0
+        for property_name, pack, width in self._encoders:
+            try:
+                field = getattr(value, property_name)
+            except AttributeError:
+                raise ValueError(f"Unable to instantiate serialisable object. Parent does not has "
+                                 f"specified property. property: {property_name}. class: {value}")
+            bits = (bits << width) | pack(field)
+        return bits
+
+    def unpack(self, obj: object, bits: int) -> None:
+        """
+        Set the group's fields of the object from the group's encoded bits.
+        :param obj: object: The object to set the fields on.
+        :param bits: int: The group's encoded bits.
+        :return: None
+        """
+        for property_name, unpack, shift, mask in self._decoders:
+            setattr(obj, property_name, unpack((bits >> shift) & mask))
+
+    def encode_into(self, data: StoredData, value: object) -> None:
+        data.add_int(self.pack(value), self.bit_size)
+
+    def decode_at(self, obj: object, data: StoredData, offset: int) -> int:
+        self.unpack(obj, data.read_int_at(offset, self.bit_size))
+        return offset + self.bit_size
+
+
+class VariableField:
+    """
+    Single field of a serialisable object whose encoded width is only known once encoded.
+    """
+
+    def __init__(self, serialise_data: SerialiseData) -> None:
+        self.serialise_data = serialise_data
+        self.bit_size = None
+        self.property_names = [serialise_data.property_name]
+
+    def encode_into(self, data: StoredData, value: object) -> None:
+        self.serialise_data.get_into(value, data)
+
+    def decode_at(self, obj: object, data: StoredData, offset: int) -> int:
+        value, offset = self.serialise_data.serialisable.deseralise_at(data, offset)
+        setattr(obj, self.serialise_data.property_name, value)
+        return offset
+
+
+class ObjectCodec:
+    """
+    Compiled codec for one version of a serialisable object's version map.
+    The version map is walked once when the codec is compiled. Adjacent fixed width fields are
+    fused into a FixedFieldGroup and every other field becomes a VariableField.
+    Codecs are cached per class and version, so the version map must not change once the class
+    has been encoded or decoded.
+    """
+
+    _codecs = {}
+
+    def __init__(self, fields: list, name: str = None) -> None:
+        """
+        Compile the codec.
+        :param fields: list: Ordered list of SerialiseData from the version map.
+        :param name: str: Name of the class and version, used to name the fields when profiled.
+        """
+        self.name = name
+        self.steps = []
+        fixed_fields = []
+        for serialise_data in fields:
+            if serialise_data.serialisable.fixed_bit_size() is not None:
+                fixed_fields.append(serialise_data)
+                continue
+            if fixed_fields:
+                self.steps.append(FixedFieldGroup(fixed_fields))
+                fixed_fields = []
+            self.steps.append(VariableField(serialise_data))
+        if fixed_fields:
+            self.steps.append(FixedFieldGroup(fixed_fields))
+        self.steps = tuple(self.steps)
+        self.field_steps = {property_name: index for index, step in enumerate(self.steps)
+                            for property_name in step.property_names}
+        self.step_names = tuple(f"{name}.{'+'.join(step.property_names)}" for step in self.steps)
+
+    @classmethod
+    def get(cls, class_type: type, version: int):
+        """
+        Get the compiled codec for the class and version. Compiles it on first use.
+        :param class_type: type: SerialisableObject subclass.
+        :param version: int: Version of the class's version map.
+        :return: ObjectCodec: The codec or None if the version is not in the version map.
+        """
+        key = (class_type, version)
+        codec = cls._codecs.get(key)
+        if codec is None:
+            if version not in class_type.version_map:
+                return None
+            codec = cls(class_type.version_map[version], f"{class_type.__qualname__} v{version}")
+            cls._codecs[key] = codec
+        return codec
+
+    @property
+    def bit_size(self) -> int:
+        """
+        The fixed number of bits the fields encode to.
+        :return: int: The number of bits or None if any field has a variable width.
+        """
+        bit_size = 0
+        for step in self.steps:
+            if step.bit_size is None:
+                return None
+            bit_size += step.bit_size
+        return bit_size
+
+    def encode_into(self, data: StoredData, value: object) -> None:
+        """
+        Encode the fields of the value into the data.
+        :param data: StoredData: The data to append the fields to.
+        :param value: object: The object holding the fields.
+        :return: None
+        """
+        if instrumentation.profiler is not None:
+            for step, step_name in zip(self.steps, self.step_names):
+                instrumentation.profiler.encode_step(step_name, step, data, value)
+            return
+        for step in self.steps:
+            step.encode_into(data, value)
+
+    def decode_at(self, obj: object, data: StoredData, offset: int) -> int:
+        """
+        Decode the fields from the data at the bit offset onto the object.
+        :param obj: object: The object to set the fields on.
+        :param data: StoredData: The data to read the fields from.
+        :param offset: int: The bit offset of the first field.
+        :return: int: The bit offset following the last field.
+        """
+        if instrumentation.profiler is not None:
+            for step, step_name in zip(self.steps, self.step_names):
+                offset = instrumentation.profiler.decode_step(step_name, step, obj, data, offset)
+            return offset
+        for step in self.steps:
+            offset = step.decode_at(obj, data, offset)
+        return offset
@@ -0,0 +1,156 @@
+import sys
+from array import array
+
+from src.main import StoredData
+from src.main.bit_array import np
+from src.main.types import SerialisableValue, SerialisableVarInt
+
+# Element types with their array module typecode and byte size.
+DTYPES = {
+    "int8": ("b", 1), "uint8": ("B", 1),
+    "int16": ("h", 2), "uint16": ("H", 2),
+    "int32": ("i", 4), "uint32": ("I", 4),
+    "int64": ("q", 8), "uint64": ("Q", 8),
+    "float32": ("f", 4), "float64": ("d", 8),
+}
+PAD_BIT_SIZE = 3  # Bits of the padding length written before the elements.
+
+
+class SerialisableArray(SerialisableValue):
+    """
+    Class for serialising typed numeric arrays.
+    Elements are stored contiguously as big endian bytes of the dtype, byte aligned within the
+    stored data. The elements are preceded by the number of padding bits used to align them,
+    so the array can be moved to another offset, e.g. inside an indexed list, and still decode.
+    The padding depends on the absolute offset the array is encoded at, so values encoded into
+    scratch data to be appended elsewhere should use StoredData.aligned_to, and encode_parallel
+    rejects lists holding arrays.
+    Dimensions of the shape that are None are written as a var int before the padding, so
+    (None,) is a length prefixed array and (480, 640) a fixed size frame.
+    With NumPy, arrays are decoded as ndarrays of the big endian dtype. Decoding from read only
+    stored data such as MappedStoredData returns a view over the stored bytes when they are byte
+    aligned, without copying. Views must be released before the mapped data is closed.
+    Without NumPy, flat array.array values are encoded and decoded instead.
+    """
+
+    def __init__(self, value=None, dtype: str = "float64", shape: tuple = (None,)) -> None:
+        super().__init__(value, 0)
+        self.dtype = dtype
+        self.shape = shape
+
+    def serialise(self, other: object = None) -> StoredData:
+        return super().serialise(other, dtype=self.dtype, shape=self.shape)
+
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super().serialise_into(data, other, dtype=self.dtype, shape=self.shape)
+
+    def deseralise(self, data: StoredData) -> object:
+        return super().deseralise(data, dtype=self.dtype, shape=self.shape)
+
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super().deseralise_at(data, offset, dtype=self.dtype, shape=self.shape)
+
+    @classmethod
+    def encode(cls, value, dtype: str = "float64", shape: tuple = (None,)) -> StoredData:
+        return super().encode(value, dtype, shape)
+
+    @classmethod
+    def encode_into(cls, data: StoredData, value, dtype: str = "float64",
+                    shape: tuple = (None,)) -> StoredData:
+        return super().encode_into(data, value, dtype, shape)
+
+    @classmethod
+    def decode(cls, data: StoredData, dtype: str = "float64", shape: tuple = (None,)):
+        return super().decode(data, dtype, shape)
+
+    @classmethod
+    def decode_at(cls, data: StoredData, offset: int, dtype: str = "float64",
+                  shape: tuple = (None,)) -> (object, int):
+        return super().decode_at(data, offset, dtype, shape)
+
+    @staticmethod
+    def _check_dtype(dtype: str) -> (str, int):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported array dtype {dtype}. Supported dtypes are "
+                             f"{', '.join(DTYPES)}.")
+        return DTYPES[dtype]
+
+    @classmethod
+    def _to_bytes(cls, value, dtype: str, shape: tuple) -> (bytes, tuple):
+        """
+        Get the big endian bytes of the elements and the shape of the value.
+        :return: (bytes, tuple): The element bytes and the shape.
+        """
+        typecode, _ = cls._check_dtype(dtype)
+        if np is not None:
+            values = np.asarray(value)
+            if values.ndim != len(shape):
+                raise ValueError(f"Unable to encode an array of {values.ndim} dimensions as "
+                                 f"shape {shape}.")
+            if values.dtype.kind in "biu" and np.dtype(dtype).kind in "iu":
+                # Int casts wrap around silently, so check the values fit instead.
+                info = np.iinfo(dtype)
+                if values.size and (int(values.min()) < int(info.min)
+                                    or int(values.max()) > int(info.max)):
+                    raise ValueError(f"Unable to encode values outside of {info.min} to "
+                                     f"{info.max} as {dtype}.")
+            elif not np.can_cast(values.dtype, dtype, casting="same_kind") and values.size:
+                raise ValueError(f"Unable to encode an array of {values.dtype} as {dtype}.")
+            values = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder(">"))
+            return values.tobytes(), values.shape
+        if len(shape) != 1:
+            raise ValueError("NumPy is required to encode arrays with more than one dimension.")
+        try:
+            values = array(typecode, value)
+        except (OverflowError, TypeError) as error:
+            raise ValueError(f"Unable to encode the array as {dtype}. {error}") from error
+        if sys.byteorder == "little":
+            values.byteswap()
+        return values.tobytes(), (len(values),)
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value, dtype: str, shape: tuple) -> None:
+        payload, value_shape = cls._to_bytes(value, dtype, shape)
+        for size, value_size in zip(shape, value_shape):
+            if size is None:
+                SerialisableVarInt.encode_into(data, value_size)
+            elif size != value_size:
+                raise ValueError(f"Unable to encode an array of shape {value_shape} as shape "
+                                 f"{shape}.")
+        padding = -(data.bit_length + PAD_BIT_SIZE) % 8
+        data.add_int(padding, PAD_BIT_SIZE)
+        if padding:
+            data.add_int(0, padding)
+        data.add_bytes(payload)
+
+    @classmethod
+    def _decode_at(cls, data: StoredData, offset: int, dtype: str, shape: tuple) -> (object, int):
+        typecode, item_size = cls._check_dtype(dtype)
+        value_shape = []
+        for size in shape:
+            if size is None:
+                size, offset = SerialisableVarInt.decode_at(data, offset)
+            value_shape.append(size)
+        offset += PAD_BIT_SIZE + data.read_int_at(offset, PAD_BIT_SIZE)
+        count = 1
+        for size in value_shape:
+            count *= size
+        byte_size = count * item_size
+        end = offset + byte_size * 8
+        if end > data.bit_length:
+            raise ValueError(f"Unable to read {byte_size} bytes of array from stored data at "
+                             f"position {offset}.")
+        if offset & 7 == 0 and isinstance(data._buffer, memoryview):
+            # Read only buffers can't be resized, so a view over them stays valid.
+            payload = data._buffer[offset >> 3:(offset >> 3) + byte_size]
+        else:
+            payload = data.read_bytes_at(offset, byte_size * 8)
+        if np is not None:
+            values = np.frombuffer(payload, dtype=np.dtype(dtype).newbyteorder(">"), count=count)
+            return values.reshape(value_shape), end
+        if len(value_shape) != 1:
+            raise ValueError("NumPy is required to decode arrays with more than one dimension.")
+        values = array(typecode, bytes(payload))
+        if sys.byteorder == "little":
+            values.byteswap()
+        return values, end
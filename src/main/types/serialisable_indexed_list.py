@@ -0,0 +1,145 @@
+from src.main import Serialisable, StoredData
+from src.main.bit_array import np, numpy_available
+from src.main.types import SerialisableList, SerialisableInt
+
+
+class SerialisableIndexedList(SerialisableList):
+    """
+    Class for serialising a list of serialisable objects with an offset index.
+    The list length is followed by a table holding the bit offset of every item relative to
+    the first item, so get_item can seek straight to any item or slice of items without
+    decoding the items before it. Each offset takes offset_bit_size bits, default 32.
+    """
+
+    def __init__(self, value: list = None, list_type: Serialisable = None,
+                 max_list_length: int = 1023, offset_bit_size: int = 32) -> None:
+        super().__init__(value, list_type, max_list_length)
+        self.offset_bit_size = offset_bit_size
+
+    def serialise(self, other: object = None) -> StoredData:
+        return super(SerialisableList, self).serialise(
+            other, list_type=self.list_type, bit_size=self.bit_size,
+            offset_bit_size=self.offset_bit_size)
+
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super(SerialisableList, self).serialise_into(
+            data, other, list_type=self.list_type, bit_size=self.bit_size,
+            offset_bit_size=self.offset_bit_size)
+
+    def deseralise(self, data: StoredData) -> object:
+        return super(SerialisableList, self).deseralise(
+            data, list_type=self.list_type, bit_size=self.bit_size,
+            offset_bit_size=self.offset_bit_size)
+
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super(SerialisableList, self).deseralise_at(
+            data, offset, list_type=self.list_type, bit_size=self.bit_size,
+            offset_bit_size=self.offset_bit_size)
+
+    def get(self, data: StoredData, index):
+        """
+        Decode a single item or slice of items of this list without moving the pointer.
+        :param data: StoredData: The binary data to read the list from.
+        :param index: int or slice: The item index or slice of items to decode.
+        :return: object: The item or list of items.
+        """
+        return self.get_item(data, index, self.list_type, bit_size=self.bit_size,
+                             offset_bit_size=self.offset_bit_size)
+
+    @classmethod
+    def encode(cls, value: list, list_type: Serialisable, max_list_length: int = 1023,
+               bit_size: int = None, offset_bit_size: int = 32) -> StoredData:
+        return super(SerialisableList, cls).encode(value, list_type, max_list_length, bit_size,
+                                                   offset_bit_size)
+
+    @classmethod
+    def encode_into(cls, data: StoredData, value: list, list_type: Serialisable,
+                    max_list_length: int = 1023, bit_size: int = None,
+                    offset_bit_size: int = 32) -> StoredData:
+        return super(SerialisableList, cls).encode_into(data, value, list_type, max_list_length,
+                                                        bit_size, offset_bit_size)
+
+    @classmethod
+    def decode(cls, data: StoredData, list_type: Serialisable, max_list_length: int = 1023,
+               bit_size: int = None, offset_bit_size: int = 32) -> list:
+        return super(SerialisableList, cls).decode(data, list_type, max_list_length, bit_size,
+                                                   offset_bit_size)
+
+    @classmethod
+    def decode_at(cls, data: StoredData, offset: int, list_type: Serialisable,
+                  max_list_length: int = 1023, bit_size: int = None,
+                  offset_bit_size: int = 32) -> (list, int):
+        return super(SerialisableList, cls).decode_at(data, offset, list_type, max_list_length,
+                                                      bit_size, offset_bit_size)
+
+    @classmethod
+    def decode_array(cls, data: StoredData, list_type: Serialisable, max_list_length: int = 1023,
+                     bit_size: int = None, offset_bit_size: int = 32):
+        if not numpy_available():
+            raise ImportError("NumPy is required to decode a SerialisableList into an array.")
+        return np.asarray(cls.decode(data, list_type, max_list_length, bit_size, offset_bit_size))
+
+    @classmethod
+    def get_item(cls, data: StoredData, index, list_type: Serialisable,
+                 max_list_length: int = 1023, bit_size: int = None, offset_bit_size: int = 32):
+        """
+        Decode a single item or slice of items of an encoded indexed list.
+        The pointer is left where it was, as with decode.
+        :param data: StoredData: The binary data to read the list from.
+        :param index: int or slice: The item index or slice of items to decode.
+        :param list_type: Serialisable: The serialisable of the list's items.
+        :param max_list_length: int: The maximum length of the list.
+        :param bit_size: int: Number of bits of the list length. Overrides max_list_length.
+        :param offset_bit_size: int: Number of bits of each offset in the index.
+        :return: object: The item or list of items.
+        """
+        bit_size = bit_size if bit_size is not None else len(bin(max_list_length)) - 2
+        start = data.position
+        list_length = data.read_int_at(start, bit_size)
+        if isinstance(index, slice):
+            positions = range(*index.indices(list_length))
+        else:
+            if index < 0:
+                index += list_length
+            if not 0 <= index < list_length:
+                raise IndexError(f"List index {index} out of range for a list of "
+                                 f"{list_length} items.")
+            positions = [index]
+        table_start = start + bit_size
+        items_start = table_start + list_length * offset_bit_size
+        items = []
+        for position in positions:
+            offset = data.read_int_at(table_start + position * offset_bit_size, offset_bit_size)
+            items.append(list_type.deseralise_at(data, items_start + offset)[0])
+        if not isinstance(index, slice):
+            return items[0]
+        return items
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: list, list_type: Serialisable,
+                     max_list_length: int, bit_size: int, offset_bit_size: int = 32) -> None:
+        bit_size = bit_size if bit_size is not None else len(bin(max_list_length)) - 2
+        SerialisableInt.encode_into(data, len(value), bit_size)
+        # Encode the items aligned as they will be behind the offsets, to keep their bits.
+        start = (data.bit_length + len(value) * offset_bit_size) & 7
+        items = StoredData.aligned_to(start)
+        for item in value:
+            offset = items.bit_length - start
+            if offset >> offset_bit_size:
+                raise ValueError(f"Unable to index list item at bit offset {offset} with "
+                                 f"{offset_bit_size} bit offsets.")
+            data.add_int(offset, offset_bit_size)
+            list_type.serialise_into(items, item)
+        data.add_from(items, start)
+
+    @classmethod
+    def _decode_at(cls, data: StoredData, offset: int, list_type: Serialisable,
+                   max_list_length: int, bit_size: int, offset_bit_size: int = 32) -> (list, int):
+        bit_size = bit_size if bit_size is not None else len(bin(max_list_length)) - 2
+        list_length = data.read_int_at(offset, bit_size)
+        offset += bit_size + list_length * offset_bit_size
+        items = []
+        for _ in range(list_length):
+            item, offset = list_type.deseralise_at(data, offset)
+            items.append(item)
+        return items, offset
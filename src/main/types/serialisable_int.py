@@ -1,3 +1,5 @@
+import operator
+
 from src.main import StoredData
 from src.main.types import SerialisableValue
 
@@ -13,22 +15,56 @@ class SerialisableInt(SerialisableValue):
     def serialise(self, other: object = None) -> StoredData:
         return super().serialise(other, bit_size=self.bit_size)
 
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super().serialise_into(data, other, bit_size=self.bit_size)
+
     def deseralise(self, data: StoredData) -> object:
         return super().deseralise(data, bit_size=self.bit_size)
 
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super().deseralise_at(data, offset, bit_size=self.bit_size)
+
+    def fixed_bit_size(self) -> int:
+        return self.bit_size if self.bit_size > 0 else None
+
+    def pack(self, value: int) -> int:
+        try:
+            value = operator.index(value)
+        except TypeError:
+            raise ValueError(f"Unable to pack {value!r} as an integer.")
+        if value < 0 or value.bit_length() > self.bit_size:
+            raise ValueError(f"Unable to pack {value} into {self.bit_size} bits.")
+        return value
+
+    def unpack(self, bits: int) -> int:
+        return bits
+
     @classmethod
     def encode(cls, value: int, bit_size: int = 0) -> StoredData:
         return super().encode(value, bit_size)
 
+    @classmethod
+    def encode_into(cls, data: StoredData, value: int, bit_size: int = 0) -> StoredData:
+        return super().encode_into(data, value, bit_size)
+
     @classmethod
     def decode(cls, data: StoredData, bit_size: int = 0) -> int:
         return super().decode(data, bit_size)
 
     @classmethod
-    def _encode(cls, value: int, bit_size: int) -> StoredData:
-        bit_value = bin(value)[2:]
-        return StoredData(bit_value, bit_size)
+    def decode_at(cls, data: StoredData, offset: int, bit_size: int = 0) -> (int, int):
+        return super().decode_at(data, offset, bit_size)
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: int, bit_size: int) -> None:
+        try:
+            value = operator.index(value)
+        except TypeError:
+            raise ValueError(f"Unable to encode {value!r} as an integer.")
+        if bit_size > 0 and value.bit_length() > bit_size:
+            raise ValueError(f"Unable to encode {value} into {bit_size} bits.")
+        data.add_int(value, bit_size)
 
     @classmethod
-    def _decode(cls, data: StoredData, bit_size: int) -> int:
-        return int(data.get_bits(bit_size), 2)
\ No newline at end of file
+    def _decode_at(cls, data: StoredData, offset: int, bit_size: int) -> (int, int):
+        return data.read_int_at(offset, bit_size), offset + bit_size
@@ -1,4 +1,6 @@
 from src.main import Serialisable, StoredData
+from src.main.bit_array import MAX_ARRAY_BIT_SIZE, np, numpy_available, pack_uint_array, \
+    unpack_uint_array
 from src.main.types import SerialisableValue, SerialisableInt
 
 
@@ -9,46 +11,128 @@ class SerialisableList(SerialisableValue):
     to binary length. Then the first part of the encoded list will contain the number of elements
     based on the length. Default is a list of max size 1023 which is 10 bits long.
     Can be List of Lists using this class inside of this class.
+    A length_type such as SerialisableVarInt can be given to encode the number of elements
+    instead of the fixed width length.
+    Lists of fixed width SerialisableInt are packed and unpacked in one go with NumPy when it is
+    installed, and decode_array returns them as an ndarray.
     """
 
+    VECTORISE_MIN_LENGTH = 32
+
     def __init__(self, value: list = None, list_type: Serialisable = None,
-                 max_list_length: int = 1023) -> None:
+                 max_list_length: int = 1023, length_type: Serialisable = None) -> None:
         super().__init__(value if value is not None else [], len(bin(max_list_length)) - 2)
         self.list_type = list_type
+        self.length_type = length_type
 
     def serialise(self, other: object = None) -> StoredData:
-        return super().serialise(other, list_type=self.list_type, bit_size=self.bit_size)
+        return super().serialise(other, list_type=self.list_type, bit_size=self.bit_size,
+                                 length_type=self.length_type)
+
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super().serialise_into(data, other, list_type=self.list_type,
+                                      bit_size=self.bit_size, length_type=self.length_type)
 
     def deseralise(self, data: StoredData) -> object:
-        return super().deseralise(data, list_type=self.list_type, bit_size=self.bit_size)
+        return super().deseralise(data, list_type=self.list_type, bit_size=self.bit_size,
+                                  length_type=self.length_type)
+
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super().deseralise_at(data, offset, list_type=self.list_type,
+                                     bit_size=self.bit_size, length_type=self.length_type)
 
     @classmethod
     def encode(cls, value: list, list_type: Serialisable, max_list_length: int = 1023,
-               bit_size: int = None) -> StoredData:
-        return super().encode(value, list_type, max_list_length, bit_size)
+               bit_size: int = None, length_type: Serialisable = None) -> StoredData:
+        return super().encode(value, list_type, max_list_length, bit_size, length_type)
+
+    @classmethod
+    def encode_into(cls, data: StoredData, value: list, list_type: Serialisable,
+                    max_list_length: int = 1023, bit_size: int = None,
+                    length_type: Serialisable = None) -> StoredData:
+        return super().encode_into(data, value, list_type, max_list_length, bit_size, length_type)
 
     @classmethod
     def decode(cls, data: StoredData, list_type: Serialisable, max_list_length: int = 1023,
-               bit_size: int = None) -> list:
-        return super().decode(data, list_type, max_list_length, bit_size)
+               bit_size: int = None, length_type: Serialisable = None) -> list:
+        return super().decode(data, list_type, max_list_length, bit_size, length_type)
+
+    @classmethod
+    def decode_at(cls, data: StoredData, offset: int, list_type: Serialisable,
+                  max_list_length: int = 1023, bit_size: int = None,
+                  length_type: Serialisable = None) -> (list, int):
+        return super().decode_at(data, offset, list_type, max_list_length, bit_size, length_type)
+
+    @classmethod
+    def decode_array(cls, data: StoredData, list_type: Serialisable, max_list_length: int = 1023,
+                     bit_size: int = None, length_type: Serialisable = None):
+        """
+        Decode the list into a NumPy array. Requires NumPy.
+        Lists of fixed width SerialisableInt are unpacked without a per item decode.
+        :param data: StoredData: The binary data to read and decode from.
+        :param list_type: Serialisable: The serialisable of the list's items.
+        :param max_list_length: int: The maximum length of the list.
+        :param bit_size: int: Number of bits of the list length. Overrides max_list_length.
+        :param length_type: Serialisable: Serialisable of the list length. Overrides bit_size.
+        :return: ndarray: The decoded list.
+        """
+        if not numpy_available():
+            raise ImportError("NumPy is required to decode a SerialisableList into an array.")
+        result, _ = cls._decode_at(data, data.position, list_type, max_list_length, bit_size,
+                                   length_type, as_array=True)
+        return result
+
+    @classmethod
+    def _vectorised_bit_size(cls, list_type: Serialisable) -> int:
+        """
+        Get the item bit size if items of the list type can be packed with NumPy.
+        :param list_type: Serialisable: The serialisable of the list's items.
+        :return: int: The item bit size or None if items must be encoded one at a time.
+        """
+        if not numpy_available() or not isinstance(list_type, SerialisableInt):
+            return None
+        item_size = list_type.fixed_bit_size()
+        if item_size is None or item_size > MAX_ARRAY_BIT_SIZE:
+            return None
+        return item_size
 
     @classmethod
-    def _encode(cls, value: list, list_type: Serialisable, max_list_length: int,
-                bit_size: int) -> StoredData:
+    def _encode_into(cls, data: StoredData, value: list, list_type: Serialisable,
+                     max_list_length: int, bit_size: int,
+                     length_type: Serialisable = None) -> None:
         bit_size = bit_size if bit_size is not None else len(bin(max_list_length)) - 2
         list_length = len(value)
-        data = SerialisableInt.encode(list_length, bit_size)
+        if length_type is not None:
+            length_type.serialise_into(data, list_length)
+        else:
+            SerialisableInt.encode_into(data, list_length, bit_size)
+        item_size = cls._vectorised_bit_size(list_type)
+        if item_size is not None and (list_length >= cls.VECTORISE_MIN_LENGTH
+                                      or isinstance(value, np.ndarray)):
+            data.add_bytes(pack_uint_array(value, item_size), list_length * item_size)
+            return
         for item in value:
-            print(list_type, item)
-            data += list_type.serialise(item)
-        return data
+            list_type.serialise_into(data, item)
 
     @classmethod
-    def _decode(cls, data: str, list_type: Serialisable, max_list_length: int,
-                bit_size: int) -> list:
+    def _decode_at(cls, data: StoredData, offset: int, list_type: Serialisable,
+                   max_list_length: int, bit_size: int, length_type: Serialisable = None,
+                   as_array: bool = False) -> (list, int):
         bit_size = bit_size if bit_size is not None else len(bin(max_list_length)) - 2
-        list_length = SerialisableInt.decode(data, bit_size)
+        if length_type is not None:
+            list_length, offset = length_type.deseralise_at(data, offset)
+        else:
+            list_length, offset = SerialisableInt.decode_at(data, offset, bit_size)
+        item_size = cls._vectorised_bit_size(list_type)
+        if item_size is not None and (as_array or list_length >= cls.VECTORISE_MIN_LENGTH):
+            array = unpack_uint_array(data.read_bytes_at(offset, list_length * item_size),
+                                      list_length, item_size)
+            offset += list_length * item_size
+            return (array if as_array else array.tolist()), offset
         data_list = []  # Return value
         for _ in range(list_length):
-            data_list.append(list_type.deseralise(data))
-        return data_list
+            item, offset = list_type.deseralise_at(data, offset)
+            data_list.append(item)
+        if as_array:
+            return np.asarray(data_list), offset
+        return data_list, offset
@@ -1,5 +1,5 @@
 from src.main import Serialisable, StoredData
-from src.main.types import SerialisableInt
+from src.main.types import SerialisableInt, ObjectCodec, LazyObject, TrackedObject
 
 
 class SerialisableObject(Serialisable):
@@ -7,6 +7,10 @@ class SerialisableObject(Serialisable):
       Serialisable map for the object.
       This acts as a version map where the key value is the version of the serialisable object.
       This contains an ordered list of StorageData.
+      Each version is compiled once into an ObjectCodec which is reused for every encode and
+      decode of the class.
+      Subclasses that also inherit TrackedObject cache the encoded bits of their fields and only
+      encode the fields that changed since the last encode.
 
     """
     version_map = {
@@ -24,32 +28,63 @@ class SerialisableObject(Serialisable):
     def encode(cls, value: object) -> StoredData:
         return super().encode(value)
 
+    @classmethod
+    def encode_into(cls, data: StoredData, value: object) -> StoredData:
+        return super().encode_into(data, value)
+
     @classmethod
     def decode(cls, data: StoredData, class_type: type = None) -> object:
         return super().decode(data, class_type)
 
     @classmethod
-    def _encode(cls, value: object) -> StoredData:
+    def decode_at(cls, data: StoredData, offset: int, class_type: type = None) -> (object, int):
+        return super().decode_at(data, offset, class_type)
+
+    @classmethod
+    def decode_lazy(cls, data: StoredData, class_type: type = None) -> object:
+        """
+        Decode the provided data into a lazy object of this class without moving the pointer.
+        Fields are only decoded when they are first accessed. Fixed width fields are located
+        from their known widths, variable width fields are decoded when a later field needs
+        their width to be located.
+        :param data: StoredData: The binary data to read and decode from.
+        :param class_type: type: The class to decode. Defaults to this class.
+        :return: object: Lazy instance of the class.
+        """
+        class_type = class_type if class_type is not None else cls
+        if not isinstance(class_type, type) or not issubclass(class_type, SerialisableObject):
+            raise AttributeError(
+                f"Specified class {class_type} to decode is not a subclass of SerialisableObject")
+        version = data.read_int_at(data.position, 8)
+        offset = data.position + 8
+        codec = ObjectCodec.get(class_type, version)
+        if codec is None:
+            return class_type()
+        return LazyObject.create(class_type, data, offset, codec)
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: object) -> None:
         if not isinstance(value, SerialisableObject):
-            return StoredData()
-        if cls.__VERSION__ not in cls.version_map:
-            return StoredData()
-        data = SerialisableInt.encode(cls.__VERSION__, 8)  # Encode the version.
-        for serialise_data in cls.version_map.get(cls.__VERSION__, []):
-            data += serialise_data.get(value)
-        return data
+            return
+        codec = ObjectCodec.get(cls, cls.__VERSION__)
+        if codec is None:
+            return
+        SerialisableInt.encode_into(data, cls.__VERSION__, 8)  # Encode the version.
+        if isinstance(value, TrackedObject):
+            value.encoded_cache(codec).encode_into(data, value)
+        else:
+            codec.encode_into(data, value)
 
     @classmethod
-    def _decode(cls, data: StoredData, class_type: type = None) -> object:
-        class_type = class_type if class_type is not None else cls.__class__
-        if not isinstance(class_type, SerialisableObject):
+    def _decode_at(cls, data: StoredData, offset: int, class_type: type = None) -> (object, int):
+        class_type = class_type if class_type is not None else cls
+        if not isinstance(class_type, type) or not issubclass(class_type, SerialisableObject):
             raise AttributeError(
                 f"Specified class {class_type} to decode is not a subclass of SerialisableObject")
-        data.record_pointer()
-        version = SerialisableInt.decode(data, 8)
-        data.update_pointer()
+        version = data.read_int_at(offset, 8)
         obj = class_type()
-        for serialise_data in obj.version_map.get(version, []):
-            serialise_data.set(obj, data)
-        return obj
+        codec = ObjectCodec.get(class_type, version)
+        if codec is not None:
+            return obj, codec.decode_at(obj, data, offset + 8)
+        return obj, offset + 8
 
@@ -0,0 +1,173 @@
+from src.main import Serialisable, StoredData
+from src.main.serialisable import message_scope
+from src.main.types import SerialisableValue, SerialisableVarInt
+
+
+class RefStats:
+    """
+    Counters measuring the size reduction of a SerialisableRef.
+    Pass an instance to SerialisableRef to have every encode add to it.
+    """
+
+    def __init__(self) -> None:
+        self.values = 0  # Values written in full.
+        self.references = 0  # Values written as a back reference.
+        self.saved_bits = 0  # Bits saved by writing back references.
+
+    def as_dict(self) -> dict:
+        return {"values": self.values, "references": self.references,
+                "saved_bits": self.saved_bits}
+
+
+class RefTable:
+    """
+    Back reference table of one value type in one stored data during one encode or decode.
+    Holds the bit offset of values already written, keyed by their encoded bits, and the values
+    already decoded with the bit offset following them, keyed by their bit offset. Both are
+    bounded to max_refs entries, dropping the oldest entry first.
+    """
+
+    def __init__(self, max_refs: int) -> None:
+        """
+        Initialise the reference table.
+        :param max_refs: int: The maximum number of entries held.
+        """
+        self.max_refs = max_refs
+        self.encoded = {}
+        self.decoded = {}
+
+    def add_encoded(self, key: tuple, offset: int) -> None:
+        if len(self.encoded) >= self.max_refs:
+            del self.encoded[next(iter(self.encoded))]
+        self.encoded[key] = offset
+
+    def add_decoded(self, offset: int, decoded: tuple) -> None:
+        if len(self.decoded) >= self.max_refs:
+            del self.decoded[next(iter(self.decoded))]
+        self.decoded[offset] = decoded
+
+
+class SerialisableRef(SerialisableValue):
+    """
+    Class for deduplicating repeated values of another serialisable.
+    Each value is written as a flag bit followed by either the encoded value or, if the same
+    encoded bits were already written earlier in the message, a back reference holding the bit
+    distance to the earlier copy as a var int. Values are compared by their encoded bits, so
+    equal strings and equal nested objects are both deduplicated.
+    The reference tables only live for one top level encode or decode, see message_scope.
+    References are relative, so a value can be decoded at any offset of the message. Within one
+    decode, repeats decode to the same instance. Every decode returns new instances.
+    A RefStats can be given to count the values, references and bits saved by every encode.
+    """
+
+    def __init__(self, value: object = None, value_type: Serialisable = None,
+                 max_refs: int = 1024, stats: RefStats = None) -> None:
+        super().__init__(value, 0)
+        self.value_type = value_type
+        self.max_refs = max_refs
+        self.stats = stats
+
+    def serialise(self, other: object = None) -> StoredData:
+        return super().serialise(other, value_type=self.value_type, max_refs=self.max_refs,
+                                 stats=self.stats)
+
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super().serialise_into(data, other, value_type=self.value_type,
+                                      max_refs=self.max_refs, stats=self.stats)
+
+    def deseralise(self, data: StoredData) -> object:
+        return super().deseralise(data, value_type=self.value_type, max_refs=self.max_refs)
+
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super().deseralise_at(data, offset, value_type=self.value_type,
+                                     max_refs=self.max_refs)
+
+    @classmethod
+    def encode(cls, value: object, value_type: Serialisable, max_refs: int = 1024,
+               stats: RefStats = None) -> StoredData:
+        return super().encode(value, value_type, max_refs, stats)
+
+    @classmethod
+    def encode_into(cls, data: StoredData, value: object, value_type: Serialisable,
+                    max_refs: int = 1024, stats: RefStats = None) -> StoredData:
+        return super().encode_into(data, value, value_type, max_refs, stats)
+
+    @classmethod
+    def decode(cls, data: StoredData, value_type: Serialisable, max_refs: int = 1024) -> object:
+        return super().decode(data, value_type, max_refs)
+
+    @classmethod
+    def decode_at(cls, data: StoredData, offset: int, value_type: Serialisable,
+                  max_refs: int = 1024) -> (object, int):
+        return super().decode_at(data, offset, value_type, max_refs)
+
+    @classmethod
+    def table(cls, data: StoredData, value_type: Serialisable, max_refs: int) -> RefTable:
+        """
+        Get the reference table of the value type in the stored data for the running encode or
+        decode.
+        :param data: StoredData: The data being encoded or decoded.
+        :param value_type: Serialisable: The serialisable of the values.
+        :param max_refs: int: The maximum number of entries of a new table.
+        :return: RefTable: The table or None outside of an encode or decode.
+        """
+        scope = message_scope()
+        if scope is None:
+            return None
+        key = (RefTable, data, value_type)
+        ref_table = scope.get(key)
+        if ref_table is None:
+            ref_table = scope[key] = RefTable(max_refs)
+        return ref_table
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: object, value_type: Serialisable,
+                     max_refs: int, stats: RefStats = None) -> None:
+        ref_table = cls.table(data, value_type, max_refs)
+        offset = data.bit_length
+        # Encode the value aligned as it would be after the flag, to keep its bits.
+        start = (offset + 1) & 7
+        encoded = value_type.serialise_into(StoredData.aligned_to(start), value)
+        bit_size = encoded.bit_length - start
+        encoded_key = (encoded.read_bytes_at(start, bit_size), bit_size)
+        target = ref_table.encoded.get(encoded_key) if ref_table is not None else None
+        if target is not None:
+            distance = SerialisableVarInt.encode(offset - target)
+            if distance.bit_length < bit_size:
+                data.add_int(1, 1)
+                data += distance
+                if stats is not None:
+                    stats.references += 1
+                    stats.saved_bits += bit_size - distance.bit_length
+                return
+        data.add_int(0, 1)
+        data.add_from(encoded, start)
+        if stats is not None:
+            stats.values += 1
+        if ref_table is not None:
+            ref_table.add_encoded(encoded_key, offset)
+
+    @classmethod
+    def _decode_at(cls, data: StoredData, offset: int, value_type: Serialisable,
+                   max_refs: int) -> (object, int):
+        ref_table = cls.table(data, value_type, max_refs)
+        if data.read_int_at(offset, 1):
+            distance, end = SerialisableVarInt.decode_at(data, offset + 1)
+            value, _ = cls._decode_value(data, offset - distance, value_type, ref_table)
+            return value, end
+        return cls._decode_value(data, offset, value_type, ref_table)
+
+    @classmethod
+    def _decode_value(cls, data: StoredData, offset: int, value_type: Serialisable,
+                      ref_table: RefTable) -> (object, int):
+        """
+        Decode the value written in full at the offset, reusing the value already decoded there
+        during this decode.
+        :return: (object, int): The value and the bit offset following it.
+        """
+        decoded = ref_table.decoded.get(offset) if ref_table is not None else None
+        if decoded is None:
+            decoded = value_type.deseralise_at(data, offset + 1)
+            if ref_table is not None:
+                ref_table.add_decoded(offset, decoded)
+        return decoded
@@ -1,5 +1,5 @@
 from src.main import StoredData
-from src.main.types import SerialisableValue, SerialisableInt
+from src.main.types import SerialisableValue
 
 
 class SerialisableString(SerialisableValue):
@@ -18,34 +18,100 @@ class SerialisableString(SerialisableValue):
         return super().serialise(other, str_length=self.str_length, encoding=self.encoding,
                                  char_size=self.char_size)
 
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super().serialise_into(data, other, str_length=self.str_length,
+                                      encoding=self.encoding, char_size=self.char_size)
+
     def deseralise(self, data: StoredData) -> object:
         return super().deseralise(data, str_length=self.str_length, encoding=self.encoding,
                                   char_size=self.char_size)
 
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super().deseralise_at(data, offset, str_length=self.str_length,
+                                     encoding=self.encoding, char_size=self.char_size)
+
+    def fixed_bit_size(self) -> int:
+        return self.str_length * self.char_size
+
+    def pack(self, value: str) -> int:
+        return self._pack(value, self.str_length, self.encoding, self.char_size)
+
+    def unpack(self, bits: int) -> str:
+        return self._unpack(bits, self.str_length, self.char_size)
+
     @classmethod
     def encode(cls, value: str, str_length: int = 64, encoding: str = 'utf-8',
                char_size: int = 8) -> StoredData:
         return super().encode(value, str_length, encoding, char_size)
 
+    @classmethod
+    def encode_into(cls, data: StoredData, value: str, str_length: int = 64,
+                    encoding: str = 'utf-8', char_size: int = 8) -> StoredData:
+        return super().encode_into(data, value, str_length, encoding, char_size)
+
     @classmethod
     def decode(cls, data: StoredData, str_length: int = 64, encoding: str = 'utf-8',
                char_size: int = 8) -> str:
         return super().decode(data, str_length, encoding, char_size)
 
     @classmethod
-    def _encode(cls, value: str, str_length: int, encoding: str, char_size: int) -> StoredData:
-        data = StoredData()
-        trimmed_value = value[:str_length].encode(encoding)
-        for _ in range(str_length - len(trimmed_value)):
-            data += SerialisableInt.encode(0, char_size)  # Add none value.
-        for character in trimmed_value:
-            data += SerialisableInt.encode(character, char_size)
-        return data
+    def decode_at(cls, data: StoredData, offset: int, str_length: int = 64,
+                  encoding: str = 'utf-8', char_size: int = 8) -> (str, int):
+        return super().decode_at(data, offset, str_length, encoding, char_size)
 
     @classmethod
-    def _decode(cls, data: StoredData, str_length: int, encoding: str, char_size: int) -> str:
-        string = ""
-        for _ in range(str_length):
-            string += chr(SerialisableInt.decode(data, char_size))
-        return string.lstrip('\0')  # Remove leading null values.
+    def _trim(cls, value: str, str_length: int, encoding: str) -> bytes:
+        """
+        Encode the string and trim it to str_length characters.
+        :return: bytes: The encoded characters without padding.
+        """
+        return value[:str_length].encode(encoding)[:str_length]
 
+    @classmethod
+    def _pack(cls, value: str, str_length: int, encoding: str, char_size: int) -> int:
+        """
+        Pack the string into an integer of str_length * char_size bits.
+        :return: int: The encoded bits of the padded string.
+        """
+        encoded = cls._trim(value, str_length, encoding)
+        if char_size == 8:
+            return int.from_bytes(encoded, "big")
+        bits = 0
+        for character in encoded:
+            if character >> char_size:
+                raise ValueError(f"Unable to pack byte {character} of {value!r} into "
+                                 f"{char_size} bits.")
+            bits = (bits << char_size) | character
+        return bits
+
+    @classmethod
+    def _unpack(cls, bits: int, str_length: int, char_size: int) -> str:
+        """
+        Unpack a string from an integer of str_length * char_size bits.
+        :return: str: The string without its leading null padding.
+        """
+        if char_size == 8:
+            return bits.to_bytes(str_length, "big").decode("latin-1").lstrip('\0')
+        mask = (1 << char_size) - 1
+        characters = [chr((bits >> shift) & mask)
+                      for shift in range((str_length - 1) * char_size, -1, -char_size)]
+        return "".join(characters).lstrip('\0')
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: str, str_length: int, encoding: str,
+                     char_size: int) -> None:
+        if char_size == 8:  # Move the padded string in one go.
+            data.add_bytes(cls._trim(value, str_length, encoding).rjust(str_length, b"\0"))
+            return
+        data.add_int(cls._pack(value, str_length, encoding, char_size), str_length * char_size)
+
+    @classmethod
+    def _decode_at(cls, data: StoredData, offset: int, str_length: int, encoding: str,
+                   char_size: int) -> (str, int):
+        bit_size = str_length * char_size
+        if char_size == 8:
+            # Each byte is one character, so latin-1 matches chr() of every byte.
+            value = data.read_bytes_at(offset, bit_size).decode("latin-1").lstrip('\0')
+        else:
+            value = cls._unpack(data.read_int_at(offset, bit_size), str_length, char_size)
+        return value, offset + bit_size
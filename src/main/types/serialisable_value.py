@@ -21,4 +21,11 @@ class SerialisableValue(Serialisable):
         """
         Override serialise to provide the value instead of self to be encoded.
         """
-        return super().serialise(other if other is not None else self.value, *args, **kwargs)
\ No newline at end of file
+        return super().serialise(other if other is not None else self.value, *args, **kwargs)
+
+    def serialise_into(self, data: StoredData, other: object = None, *args, **kwargs) -> StoredData:
+        """
+        Override serialise_into to provide the value instead of self to be encoded.
+        """
+        return super().serialise_into(data, other if other is not None else self.value, *args,
+                                      **kwargs)
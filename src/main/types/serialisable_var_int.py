@@ -0,0 +1,83 @@
+from src.main import StoredData
+from src.main.types import SerialisableValue
+
+
+class SerialisableVarInt(SerialisableValue):
+    """
+    Class for serialising integers with a variable length encoding.
+    The integer is split into 7 bit groups, least significant group first, and each group is
+    written as a byte whose top bit is set when more groups follow (LEB128). Values below 128
+    take 8 bits. Signed integers are zigzag mapped first so small negative values stay small.
+    """
+
+    def __init__(self, value: int = 0, signed: bool = False):
+        super().__init__(value, 0)
+        self.signed = signed
+
+    def serialise(self, other: object = None) -> StoredData:
+        return super().serialise(other, signed=self.signed)
+
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super().serialise_into(data, other, signed=self.signed)
+
+    def deseralise(self, data: StoredData) -> object:
+        return super().deseralise(data, signed=self.signed)
+
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super().deseralise_at(data, offset, signed=self.signed)
+
+    @classmethod
+    def encode(cls, value: int, signed: bool = False) -> StoredData:
+        return super().encode(value, signed)
+
+    @classmethod
+    def encode_into(cls, data: StoredData, value: int, signed: bool = False) -> StoredData:
+        return super().encode_into(data, value, signed)
+
+    @classmethod
+    def decode(cls, data: StoredData, signed: bool = False) -> int:
+        return super().decode(data, signed)
+
+    @classmethod
+    def decode_at(cls, data: StoredData, offset: int, signed: bool = False) -> (int, int):
+        return super().decode_at(data, offset, signed)
+
+    @staticmethod
+    def zigzag(value: int) -> int:
+        """
+        Map a signed integer onto a non negative integer. 0, -1, 1, -2 map to 0, 1, 2, 3.
+        """
+        return value << 1 if value >= 0 else (-value << 1) - 1
+
+    @staticmethod
+    def unzigzag(value: int) -> int:
+        """
+        Reverse the zigzag mapping.
+        """
+        return (value >> 1) ^ -(value & 1)
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: int, signed: bool) -> None:
+        if signed:
+            value = cls.zigzag(value)
+        elif value < 0:
+            raise ValueError(f"Unable to encode negative value {value} as an unsigned var int.")
+        groups = bytearray()
+        while value > 0x7F:
+            groups.append((value & 0x7F) | 0x80)
+            value >>= 7
+        groups.append(value)
+        data.add_bytes(groups)
+
+    @classmethod
+    def _decode_at(cls, data: StoredData, offset: int, signed: bool) -> (int, int):
+        value = 0
+        shift = 0
+        while True:
+            group = data.read_int_at(offset, 8)
+            offset += 8
+            value |= (group & 0x7F) << shift
+            if group < 0x80:
+                break
+            shift += 7
+        return cls.unzigzag(value) if signed else value, offset
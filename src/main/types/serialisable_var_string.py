@@ -0,0 +1,68 @@
+from src.main import StoredData
+from src.main.types import SerialisableValue, SerialisableInt
+
+
+class SerialisableVarString(SerialisableValue):
+    """
+    Class responsible for serialising a variable length string value.
+    The encoded bytes of the string are prefixed with their length, so short strings don't pay
+    for padding. The specified maximum string length in bytes is converted to the binary length
+    of the prefix, as with SerialisableList. Default is a maximum of 255 bytes, an 8 bit prefix.
+    """
+
+    def __init__(self, value: str = "", max_str_length: int = 255, encoding: str = "utf-8"):
+        super().__init__(value, len(bin(max_str_length)) - 2)
+        self.max_str_length = max_str_length
+        self.encoding = encoding
+
+    def serialise(self, other: object = None) -> StoredData:
+        return super().serialise(other, max_str_length=self.max_str_length,
+                                 encoding=self.encoding)
+
+    def serialise_into(self, data: StoredData, other: object = None) -> StoredData:
+        return super().serialise_into(data, other, max_str_length=self.max_str_length,
+                                      encoding=self.encoding)
+
+    def deseralise(self, data: StoredData) -> object:
+        return super().deseralise(data, max_str_length=self.max_str_length,
+                                  encoding=self.encoding)
+
+    def deseralise_at(self, data: StoredData, offset: int) -> (object, int):
+        return super().deseralise_at(data, offset, max_str_length=self.max_str_length,
+                                     encoding=self.encoding)
+
+    @classmethod
+    def encode(cls, value: str, max_str_length: int = 255, encoding: str = 'utf-8') -> StoredData:
+        return super().encode(value, max_str_length, encoding)
+
+    @classmethod
+    def encode_into(cls, data: StoredData, value: str, max_str_length: int = 255,
+                    encoding: str = 'utf-8') -> StoredData:
+        return super().encode_into(data, value, max_str_length, encoding)
+
+    @classmethod
+    def decode(cls, data: StoredData, max_str_length: int = 255, encoding: str = 'utf-8') -> str:
+        return super().decode(data, max_str_length, encoding)
+
+    @classmethod
+    def decode_at(cls, data: StoredData, offset: int, max_str_length: int = 255,
+                  encoding: str = 'utf-8') -> (str, int):
+        return super().decode_at(data, offset, max_str_length, encoding)
+
+    @classmethod
+    def _encode_into(cls, data: StoredData, value: str, max_str_length: int,
+                     encoding: str) -> None:
+        encoded = value.encode(encoding)
+        if len(encoded) > max_str_length:
+            # Trim to whole characters so the stored bytes always decode.
+            encoded = encoded[:max_str_length].decode(encoding, "ignore").encode(encoding)
+        SerialisableInt.encode_into(data, len(encoded), len(bin(max_str_length)) - 2)
+        data.add_bytes(encoded)
+
+    @classmethod
+    def _decode_at(cls, data: StoredData, offset: int, max_str_length: int,
+                   encoding: str) -> (str, int):
+        length_size = len(bin(max_str_length)) - 2
+        str_length = data.read_int_at(offset, length_size)
+        offset += length_size
+        return data.read_bytes_at(offset, str_length * 8).decode(encoding), offset + str_length * 8
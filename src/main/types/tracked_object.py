@@ -0,0 +1,118 @@
+from src.main import StoredData
+from src.main.serialisable import contains_type
+from src.main.types import SerialisableArray, SerialisableRef
+
+CACHED, ALIGNED, DIRECT = range(3)  # How each step of an encoded cache is encoded.
+
+
+class EncodedCache:
+    """
+    Encoded bits of every step of a serialisable object's codec.
+    Steps are encoded on first use and reused until one of their fields is invalidated, so the
+    output is the same as encoding every step.
+    Steps holding arrays are cached with the bit of a byte they were encoded at, as array padding
+    depends on it, and are encoded again when they move to another bit. Steps holding refs are
+    never cached, as their back references depend on the rest of the message.
+    """
+
+    def __init__(self, codec) -> None:
+        """
+        Initialise the encoded cache.
+        :param codec: ObjectCodec: The compiled codec the steps are encoded with.
+        """
+        self.codec = codec
+        self.steps = [None] * len(codec.steps)
+        self.modes = tuple(self._mode(step) for step in codec.steps)
+
+    @staticmethod
+    def _mode(step) -> int:
+        serialise_data = getattr(step, "serialise_data", None)
+        if serialise_data is None:  # Fixed width groups don't depend on their position.
+            return CACHED
+        if contains_type(serialise_data.serialisable, SerialisableRef):
+            return DIRECT
+        if contains_type(serialise_data.serialisable, SerialisableArray):
+            return ALIGNED
+        return CACHED
+
+    def invalidate(self, property_name: str = None) -> None:
+        """
+        Drop the cached bits of the step holding the field, or of every step.
+        :param property_name: str: The changed field. Defaults to every field.
+        :return: None
+        """
+        if property_name is None:
+            self.steps = [None] * len(self.codec.steps)
+            return
+        index = self.codec.field_steps.get(property_name)
+        if index is not None:
+            self.steps[index] = None
+
+    def encode_into(self, data: StoredData, value: object) -> None:
+        """
+        Append the encoded fields of the value, encoding only the steps that are not cached.
+        :param data: StoredData: The data to append the fields to.
+        :param value: object: The object holding the fields.
+        :return: None
+        """
+        for index, step in enumerate(self.codec.steps):
+            mode = self.modes[index]
+            if mode == DIRECT:
+                step.encode_into(data, value)
+                continue
+            start = data.bit_length & 7 if mode == ALIGNED else 0
+            cached = self.steps[index]
+            if cached is None or cached[0] != start:
+                encoded = StoredData.aligned_to(start)
+                step.encode_into(encoded, value)
+                cached = self.steps[index] = (start, encoded)
+            data.add_from(cached[1], start)
+
+
+class TrackedObject:
+    """
+    Mixin for serialisable objects that are encoded many times with few changes in between.
+    The encoded bits of every field are cached on the first encode. Assigning a field drops its
+    cached bits, so the next encode only encodes the changed fields and copies the rest.
+    Changes made in place, such as appending to a list field, are not seen and must be flagged
+    with mark_dirty.
+    """
+
+    def __setattr__(self, name: str, value: object) -> None:
+        cache = self.__dict__.get("_encoded_cache")
+        if cache is not None:
+            cache.invalidate(name)
+        super().__setattr__(name, value)
+
+    def mark_dirty(self, *property_names: str) -> None:
+        """
+        Flag fields as changed so they are encoded again.
+        :param property_names: str: The changed fields. Defaults to every field.
+        :return: None
+        """
+        cache = self.__dict__.get("_encoded_cache")
+        if cache is None:
+            return
+        if not property_names:
+            cache.invalidate()
+        for property_name in property_names:
+            cache.invalidate(property_name)
+
+    def encoded_cache(self, codec) -> EncodedCache:
+        """
+        Get the encoded cache of the object for the codec. A new cache is started if the object
+        was last encoded with another codec.
+        :param codec: ObjectCodec: The compiled codec the object is encoded with.
+        :return: EncodedCache
+        """
+        cache = self.__dict__.get("_encoded_cache")
+        if cache is None or cache.codec is not codec:
+            cache = EncodedCache(codec)
+            self.__dict__["_encoded_cache"] = cache
+        return cache
+
+    def __getstate__(self) -> dict:
+        # Copies and pickles start without a cache, so they never share one with the original.
+        state = dict(self.__dict__)
+        state.pop("_encoded_cache", None)
+        return state
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+
+from src.main.async_stream import iter_messages, read_message, write_message, write_messages
+from src.main.record_stream import BLOCK_MARKER, FRAME_HEADER, INDEX_MARKER
+from src.main.serialise_data import SerialiseData
+from src.main.types import SerialisableInt, SerialisableObject, SerialisableVarString
+
+
+class Message(SerialisableObject):
+    version_map = {0: [SerialiseData("id", SerialisableInt(0, 16)),
+                       SerialiseData("text", SerialisableVarString())]}
+
+    def __init__(self, number: int = 0, text: str = "") -> None:
+        super().__init__()
+        self.id = number
+        self.text = text
+
+
+class AsyncStreamTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Round trips messages through a loopback TCP server that echoes every byte back.
+    """
+
+    async def asyncSetUp(self):
+        async def echo(reader, writer):
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                writer.write(chunk)
+                await writer.drain()
+            writer.close()
+
+        self.server = await asyncio.start_server(echo, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_write_and_read_message(self):
+        written = await write_message(self.writer, Message(7, "hello"))
+        message = await read_message(self.reader, Message)
+        self.assertEqual((message.id, message.text), (7, "hello"))
+        self.assertEqual(written, FRAME_HEADER.size + len(Message.encode(Message(7, "hello"))
+                                                          .to_bytes()))
+
+    async def test_write_messages_batches_into_one_write(self):
+        messages = [Message(index, "x" * index) for index in range(50)]
+        writes = []
+        original = self.writer.write
+        self.writer.write = lambda data: (writes.append(data), original(data))
+        await write_messages(self.writer, messages)
+        self.assertEqual(len(writes), 1)
+        decoded = [await read_message(self.reader, Message) for _ in messages]
+        self.assertEqual([(item.id, item.text) for item in decoded],
+                         [(item.id, item.text) for item in messages])
+
+    async def test_iter_messages_until_end(self):
+        await write_messages(self.writer, [Message(1, "a"), Message(2, "b")])
+        self.writer.write_eof()
+        decoded = [message.id async for message in iter_messages(self.reader, Message)]
+        self.assertEqual(decoded, [1, 2])
+
+    async def test_record_type_for_plain_values(self):
+        await write_message(self.writer, 300, SerialisableInt(0, 12))
+        self.assertEqual(await read_message(self.reader, SerialisableInt(0, 12)), 300)
+
+    async def test_end_of_stream_between_messages(self):
+        self.writer.write_eof()
+        self.assertIsNone(await read_message(self.reader, Message))
+
+
+class AsyncStreamErrorTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Feeds raw bytes into a stream reader to check malformed streams are rejected.
+    """
+
+    def reader(self, data: bytes) -> asyncio.StreamReader:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    async def test_truncated_header(self):
+        with self.assertRaises(ValueError):
+            await read_message(self.reader(b"\x00\x00"), Message)
+
+    async def test_truncated_payload(self):
+        with self.assertRaises(ValueError):
+            await read_message(self.reader(FRAME_HEADER.pack(64) + b"\x00\x01"), Message)
+
+    async def test_message_over_max_record_size(self):
+        with self.assertRaises(ValueError):
+            await read_message(self.reader(FRAME_HEADER.pack(800) + bytes(100)), Message, 10)
+
+    async def test_compressed_block_rejected(self):
+        with self.assertRaises(ValueError):
+            await read_message(self.reader(FRAME_HEADER.pack(BLOCK_MARKER)), Message)
+
+    async def test_index_footer_ends_stream(self):
+        self.assertIsNone(await read_message(self.reader(FRAME_HEADER.pack(INDEX_MARKER)),
+                                             Message))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.main.parallel import decode_parallel, encode_parallel, encode_records_parallel
+from src.main.record_stream import serialise_record
+from src.main.serialise_data import SerialiseData
+from src.main.types import SerialisableArray, SerialisableIndexedList, SerialisableInt, \
+    SerialisableList, SerialisableObject, SerialisableRef, SerialisableVarString
+
+
+class Item(SerialisableObject):
+    version_map = {0: [SerialiseData("number", SerialisableInt(0, 5)),
+                       SerialiseData("text", SerialisableVarString())]}
+
+    def __init__(self, number: int = 0, text: str = "") -> None:
+        super().__init__()
+        self.number = number
+        self.text = text
+
+
+class Samples(SerialisableObject):
+    version_map = {0: [SerialiseData("values", SerialisableArray(dtype="int16"))]}
+
+
+ITEMS = [Item(index % 32, "t" * (index % 7)) for index in range(100)]
+
+
+def fields(items: list) -> list:
+    return [(item.number, item.text) for item in items]
+
+
+class ParallelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(4)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_bit_identical_to_serial(self):
+        for chunk_size in (1, 7, 100, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                data = encode_parallel(ITEMS, Item(), chunk_size=chunk_size,
+                                       executor=self.executor)
+                expected = SerialisableList.encode(ITEMS, Item())
+                self.assertEqual(data.bit_length, expected.bit_length)
+                self.assertEqual(data.to_bytes(), expected.to_bytes())
+
+    def test_indexed_bit_identical_to_serial(self):
+        data = encode_parallel(ITEMS, Item(), chunk_size=9, indexed=True, workers=1)
+        expected = SerialisableIndexedList.encode(ITEMS, Item())
+        self.assertEqual(data.to_bytes(), expected.to_bytes())
+
+    def test_decode_parallel(self):
+        data = SerialisableIndexedList.encode(ITEMS, Item())
+        for chunk_size in (1, 13, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                decoded = decode_parallel(data, Item(), chunk_size=chunk_size,
+                                          executor=self.executor)
+                self.assertEqual(fields(decoded), fields(ITEMS))
+
+    def test_empty_list(self):
+        data = encode_parallel([], Item(), indexed=True, workers=1)
+        self.assertEqual(decode_parallel(data, Item(), workers=1), [])
+
+    def test_encode_records(self):
+        encoded = encode_records_parallel(ITEMS, chunk_size=10, executor=self.executor)
+        self.assertEqual([data.to_bytes() for data in encoded],
+                         [serialise_record(item).to_bytes() for item in ITEMS])
+
+    def test_offset_too_wide(self):
+        with self.assertRaises(ValueError):
+            encode_parallel(ITEMS, Item(), indexed=True, offset_bit_size=4, workers=1)
+
+    def test_refs_rejected(self):
+        ref = SerialisableRef(value_type=SerialisableVarString())
+        data = SerialisableIndexedList.encode(["a", "a"], ref)
+        for list_type in (ref, SerialisableList(list_type=ref)):
+            with self.subTest(list_type=type(list_type).__name__):
+                with self.assertRaises(ValueError):
+                    encode_parallel(["a", "a"], list_type, workers=1)
+        with self.assertRaises(ValueError):
+            decode_parallel(data, ref, workers=1)
+
+    def test_arrays_rejected(self):
+        with self.assertRaises(ValueError):
+            encode_parallel([[1, 2]], SerialisableArray(dtype="int16"), workers=1)
+        with self.assertRaises(ValueError):
+            encode_parallel([Samples()], Samples(), workers=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
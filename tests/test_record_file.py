@@ -0,0 +1,171 @@
+import os
+import tempfile
+import unittest
+
+from src.main.record_file import RecordFile
+from src.main.serialise_data import SerialiseData
+from src.main.types import SerialisableInt, SerialisableObject, SerialisableString, \
+    SerialisableVarString
+
+
+class Point(SerialisableObject):
+    version_map = {
+        0: [SerialiseData("x", SerialisableInt(0, 12)),
+            SerialiseData("y", SerialisableInt(0, 12))],
+        1: [SerialiseData("x", SerialisableInt(0, 12)),
+            SerialiseData("y", SerialisableInt(0, 12)),
+            SerialiseData("label", SerialisableString("", 3, char_size=7))],
+    }
+    __VERSION__ = 1
+
+    def __init__(self, x: int = 0, y: int = 0, label: str = "") -> None:
+        super().__init__()
+        self.x = x
+        self.y = y
+        self.label = label
+
+
+class Named(SerialisableObject):
+    version_map = {0: [SerialiseData("name", SerialisableVarString())]}
+
+
+def fields(points: list) -> list:
+    return [(point.x, point.y, point.label) for point in points]
+
+
+POINTS = [Point(index, 4095 - index, f"p{index % 10}") for index in range(100)]
+
+
+class RecordFileTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "points.rec")
+
+    def create(self, points: list = POINTS) -> None:
+        with RecordFile(self.path, Point, "w") as records:
+            records.extend(points)
+
+    def test_round_trip(self):
+        self.create()
+        with RecordFile(self.path, Point) as records:
+            self.assertEqual(len(records), len(POINTS))
+            self.assertEqual(fields(records), fields(POINTS))
+
+    def test_fixed_stride(self):
+        self.create()
+        header = RecordFile(self.path, Point)
+        header.close()
+        # 12 + 12 + 3 * 7 bits pad to 6 bytes per record.
+        self.assertEqual(header.record_size, 6)
+        self.assertEqual(os.path.getsize(self.path), header._start + 6 * len(POINTS))
+
+    def test_index_and_slice(self):
+        self.create()
+        with RecordFile(self.path, Point) as records:
+            self.assertEqual(fields([records[42]]), fields([POINTS[42]]))
+            self.assertEqual(fields([records[-1]]), fields([POINTS[-1]]))
+            self.assertEqual(fields(records[10:20]), fields(POINTS[10:20]))
+            self.assertEqual(fields(records[::9]), fields(POINTS[::9]))
+            self.assertEqual(records[5:5], [])
+
+    def test_update_in_place(self):
+        self.create()
+        with RecordFile(self.path, Point, "r+") as records:
+            records[3] = Point(1, 2, "new")
+            records[10:12] = [Point(5, 5, "a"), Point(6, 6, "b")]
+        with RecordFile(self.path, Point) as records:
+            self.assertEqual(fields(records[3:4]), [(1, 2, "new")])
+            self.assertEqual(fields(records[10:12]), [(5, 5, "a"), (6, 6, "b")])
+            self.assertEqual(fields([records[4]]), fields([POINTS[4]]))
+
+    def test_append_after_reopen(self):
+        self.create(POINTS[:10])
+        with RecordFile(self.path, Point, "r+") as records:
+            records.append(POINTS[10])
+            records.extend(POINTS[11:20])
+            self.assertEqual(len(records), 20)
+        with RecordFile(self.path, Point) as records:
+            self.assertEqual(fields(records), fields(POINTS[:20]))
+
+    def test_older_version(self):
+        with RecordFile(self.path, Point, "w", version=0) as records:
+            records.append(Point(7, 8))
+        with RecordFile(self.path, Point) as records:
+            self.assertEqual(records.version, 0)
+            self.assertEqual((records[0].x, records[0].y), (7, 8))
+
+    def test_empty_file(self):
+        self.create([])
+        with RecordFile(self.path, Point) as records:
+            self.assertEqual(len(records), 0)
+            self.assertEqual(list(records), [])
+
+
+class RecordFileErrorTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "points.rec")
+        with RecordFile(self.path, Point, "w") as records:
+            records.extend(POINTS[:5])
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            RecordFile(self.path, Point, "a")
+
+    def test_variable_width_fields(self):
+        with self.assertRaises(ValueError):
+            RecordFile(self.path + "2", Named, "w")
+        self.assertFalse(os.path.exists(self.path + "2"))
+
+    def test_unknown_version(self):
+        with self.assertRaises(ValueError):
+            RecordFile(self.path + "2", Point, "w", version=5)
+
+    def test_other_class(self):
+        with self.assertRaises(ValueError):
+            RecordFile(self.path, Named)
+
+    def test_not_a_record_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a record file at all")
+        with self.assertRaises(ValueError):
+            RecordFile(self.path, Point)
+
+    def test_truncated_file(self):
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+        with self.assertRaises(ValueError):
+            RecordFile(self.path, Point)
+
+    def test_index_out_of_range(self):
+        with RecordFile(self.path, Point) as records:
+            with self.assertRaises(IndexError):
+                records[5]
+
+    def test_read_only(self):
+        with RecordFile(self.path, Point) as records:
+            with self.assertRaises(AttributeError):
+                records[0] = POINTS[0]
+            with self.assertRaises(AttributeError):
+                records.append(POINTS[0])
+
+    def test_value_too_wide(self):
+        with RecordFile(self.path, Point, "r+") as records:
+            with self.assertRaises(ValueError):
+                records[0] = Point(4096, 0)
+            with self.assertRaises(ValueError):
+                records.append(Point(0, 0, "é"))
+            self.assertEqual(len(records), 5)
+
+    def test_slice_length_mismatch(self):
+        with RecordFile(self.path, Point, "r+") as records:
+            with self.assertRaises(ValueError):
+                records[0:2] = POINTS[:3]
+
+
+if __name__ == "__main__":
+    unittest.main()
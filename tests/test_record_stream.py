@@ -0,0 +1,132 @@
+import io
+import unittest
+
+from src.main.record_stream import FRAME_HEADER, IndexedRecordReader, RecordReader, \
+    RecordWriter, iter_decode
+from src.main.serialise_data import SerialiseData
+from src.main.types import SerialisableInt, SerialisableObject, SerialisableVarString
+
+
+class Entry(SerialisableObject):
+    version_map = {0: [SerialiseData("number", SerialisableInt(0, 16)),
+                       SerialiseData("text", SerialisableVarString())]}
+
+    def __init__(self, number: int = 0, text: str = "") -> None:
+        super().__init__()
+        self.number = number
+        self.text = text
+
+
+ENTRIES = [Entry(index, f"entry {index}" * (index % 4)) for index in range(200)]
+
+
+def fields(entries: list) -> list:
+    return [(entry.number, entry.text) for entry in entries]
+
+
+def write(index: bool = False, compression=None, block_size: int = 512,
+          prefix: bytes = b"") -> io.BytesIO:
+    stream = io.BytesIO()
+    stream.write(prefix)
+    with RecordWriter(stream, Entry, index=index, compression=compression,
+                      block_size=block_size) as writer:
+        for entry in ENTRIES:
+            writer.write(entry)
+    stream.seek(len(prefix))
+    return stream
+
+
+class RecordStreamTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        self.assertEqual(fields(RecordReader(write(), Entry)), fields(ENTRIES))
+
+    def test_round_trip_compressed(self):
+        for compression in ("zlib", "bz2", "lzma"):
+            with self.subTest(compression=compression):
+                stream = write(compression=compression)
+                self.assertEqual(fields(iter_decode(stream, Entry)), fields(ENTRIES))
+
+    def test_compressed_is_smaller(self):
+        self.assertLess(len(write(compression="zlib").getvalue()), len(write().getvalue()))
+
+    def test_sequential_reader_stops_at_index(self):
+        self.assertEqual(fields(RecordReader(write(index=True), Entry)), fields(ENTRIES))
+
+    def test_read_returns_none_at_end(self):
+        reader = RecordReader(io.BytesIO(), Entry)
+        self.assertIsNone(reader.read())
+
+    def test_plain_record_type(self):
+        stream = io.BytesIO()
+        with RecordWriter(stream, SerialisableInt(0, 5)) as writer:
+            for value in range(32):
+                writer.write(value)
+        stream.seek(0)
+        self.assertEqual(list(RecordReader(stream, SerialisableInt(0, 5))), list(range(32)))
+
+
+class IndexedRecordReaderTest(unittest.TestCase):
+
+    def test_random_access(self):
+        for compression in (None, "zlib"):
+            with self.subTest(compression=compression):
+                reader = IndexedRecordReader(write(index=True, compression=compression), Entry)
+                self.assertEqual(len(reader), len(ENTRIES))
+                for index in (0, 199, 57, 58, 3, -1, -200):
+                    self.assertEqual(fields([reader[index]]), fields([ENTRIES[index]]))
+                self.assertEqual(fields(reader[10:20]), fields(ENTRIES[10:20]))
+                self.assertEqual(fields(reader[::-7]), fields(ENTRIES[::-7]))
+
+    def test_index_after_leading_bytes(self):
+        reader = IndexedRecordReader(write(index=True, prefix=b"header"), Entry)
+        self.assertEqual(fields([reader[5]]), fields([ENTRIES[5]]))
+
+    def test_index_out_of_range(self):
+        reader = IndexedRecordReader(write(index=True), Entry)
+        with self.assertRaises(IndexError):
+            reader[len(ENTRIES)]
+
+    def test_missing_index(self):
+        with self.assertRaises(ValueError):
+            IndexedRecordReader(write(), Entry)
+
+
+class RecordStreamErrorTest(unittest.TestCase):
+
+    def test_truncated_header(self):
+        with self.assertRaises(ValueError):
+            RecordReader(io.BytesIO(b"\x00\x00"), Entry).read()
+
+    def test_truncated_record(self):
+        data = write().getvalue()
+        with self.assertRaises(ValueError):
+            list(RecordReader(io.BytesIO(data[:-1]), Entry))
+
+    def test_truncated_block(self):
+        data = write(compression="zlib").getvalue()
+        with self.assertRaises(ValueError):
+            list(RecordReader(io.BytesIO(data[:-1]), Entry))
+
+    def test_max_record_size(self):
+        stream = io.BytesIO(FRAME_HEADER.pack(8000) + bytes(1000))
+        with self.assertRaises(ValueError):
+            RecordReader(stream, Entry, max_record_size=100).read()
+
+    def test_write_after_close(self):
+        writer = RecordWriter(io.BytesIO(), Entry)
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(ENTRIES[0])
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            RecordWriter(io.BytesIO(), Entry, compression="unknown")
+
+    def test_plain_value_without_record_type(self):
+        with self.assertRaises(ValueError):
+            RecordWriter(io.BytesIO()).write(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
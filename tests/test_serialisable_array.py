@@ -0,0 +1,166 @@
+import os
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+from src.main import MappedStoredData, StoredData
+from src.main.bit_array import np
+from src.main.types import SerialisableArray, SerialisableIndexedList, SerialisableList, \
+    SerialisableRef, serialisable_array
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class SerialisableArrayTest(unittest.TestCase):
+
+    def test_round_trip_dtypes(self):
+        for dtype in serialisable_array.DTYPES:
+            with self.subTest(dtype=dtype):
+                values = np.arange(10).astype(dtype)
+                decoded = SerialisableArray.decode(SerialisableArray.encode(values, dtype), dtype)
+                self.assertEqual(decoded.dtype, np.dtype(dtype).newbyteorder(">"))
+                np.testing.assert_array_equal(decoded, values)
+
+    def test_fixed_shape(self):
+        frame = np.arange(12, dtype=np.float32).reshape(3, 4)
+        data = SerialisableArray.encode(frame, "float32", (3, 4))
+        # No length prefix, 3 padding bits, 5 bits of padding then 48 bytes of elements.
+        self.assertEqual(data.bit_length, 8 + 48 * 8)
+        np.testing.assert_array_equal(SerialisableArray.decode(data, "float32", (3, 4)), frame)
+
+    def test_mixed_shape(self):
+        frame = np.ones((5, 2), dtype=np.uint16)
+        data = SerialisableArray.encode(frame, "uint16", (None, 2))
+        np.testing.assert_array_equal(SerialisableArray.decode(data, "uint16", (None, 2)), frame)
+
+    def test_big_endian_bytes(self):
+        # Length 2, then padding 5 written in 3 bits and 5 bits of padding before the elements.
+        data = SerialisableArray.encode([1, 258], "uint16")
+        self.assertEqual(data.to_bytes(), b"\x02\xa0\x00\x01\x01\x02")
+
+    def test_unaligned_offset(self):
+        data = StoredData()
+        data.add_int(1, 3)
+        SerialisableArray.encode_into(data, [1.5, -2.5], "float64")
+        values, end = SerialisableArray.decode_at(data, 3, "float64")
+        np.testing.assert_array_equal(values, [1.5, -2.5])
+        self.assertEqual(end, data.bit_length)
+        self.assertEqual((end - 16 * 8) % 8, 0)
+
+    def test_same_bits_in_indexed_list_and_refs(self):
+        arrays = [np.arange(size, dtype=np.int16) for size in (3, 5, 5, 1)]
+        element = SerialisableArray(dtype="int16")
+        for list_type in (element, SerialisableRef(value_type=element)):
+            with self.subTest(list_type=type(list_type).__name__):
+                data = StoredData()
+                data.add_int(0, 3)
+                SerialisableIndexedList.encode_into(data, arrays, list_type)
+                decoded = SerialisableIndexedList.decode_at(self.read_only(data), 3,
+                                                            list_type)[0]
+                for value, expected in zip(decoded, arrays):
+                    np.testing.assert_array_equal(value, expected)
+                    self.assertFalse(value.flags.owndata)  # Aligned, so a view.
+
+    def test_view_over_mapped_data(self):
+        values = np.arange(1000, dtype=np.float64)
+        data = StoredData()
+        data.add_int(1, 1)
+        SerialisableArray.encode_into(data, values)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "array.bin")
+        with open(path, "wb") as file:
+            file.write(data.to_bytes())
+        mapped = MappedStoredData(path, bit_length=data.bit_length)
+        decoded, _ = SerialisableArray.decode_at(mapped, 1)
+        self.assertFalse(decoded.flags.owndata)
+        self.assertFalse(decoded.flags.writeable)
+        np.testing.assert_array_equal(decoded, values)
+        del decoded
+        mapped.close()
+
+    def test_copy_from_writable_data(self):
+        data = SerialisableArray.encode([1, 2, 3], "int32")
+        decoded = SerialisableArray.decode(data, "int32")
+        data.add_int(0, 64)  # Growing the buffer must not affect the decoded array.
+        np.testing.assert_array_equal(decoded, [1, 2, 3])
+
+    def test_out_of_range_ints(self):
+        for values, dtype in (([256], "uint8"), ([-1], "uint32"), ([2 ** 40], "int32"),
+                              (np.array([2 ** 64 - 1], dtype=np.uint64), "int64")):
+            with self.subTest(values=values, dtype=dtype):
+                with self.assertRaises(ValueError):
+                    SerialisableArray.encode(values, dtype)
+
+    def test_in_range_ints_of_other_dtypes(self):
+        data = SerialisableArray.encode(np.array([0, 255], dtype=np.int64), "uint8")
+        np.testing.assert_array_equal(SerialisableArray.decode(data, "uint8"), [0, 255])
+
+    def test_float_to_int_rejected(self):
+        with self.assertRaises(ValueError):
+            SerialisableArray.encode([1.5], "int32")
+
+    def test_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            SerialisableArray.encode(np.zeros((2, 3)), "float64", (3, 2))
+        with self.assertRaises(ValueError):
+            SerialisableArray.encode(np.zeros(4), "float64", (None, None))
+
+    def test_unsupported_dtype(self):
+        with self.assertRaises(ValueError):
+            SerialisableArray.encode([1], "complex128")
+
+    def test_truncated(self):
+        data = SerialisableArray.encode(np.arange(4, dtype=np.int32), "int32")
+        truncated = StoredData.from_bytes(data.to_bytes()[:-1])
+        with self.assertRaises(ValueError):
+            SerialisableArray.decode(truncated, "int32")
+
+    def test_list_of_arrays(self):
+        arrays = [np.arange(size, dtype=np.uint8) for size in range(6)]
+        decoded = SerialisableList.decode(SerialisableList.encode(arrays, SerialisableArray(
+            dtype="uint8")), SerialisableArray(dtype="uint8"))
+        for value, expected in zip(decoded, arrays):
+            np.testing.assert_array_equal(value, expected)
+
+    @staticmethod
+    def read_only(data: StoredData) -> StoredData:
+        read_only = StoredData.from_bytes(data.to_bytes(), data.bit_length)
+        read_only._buffer = memoryview(bytes(read_only._buffer))
+        return read_only
+
+
+class SerialisableArrayFallbackTest(unittest.TestCase):
+    """
+    Encodes and decodes array.array values as done without NumPy.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(serialisable_array, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        values = array("h", [1, -2, 300])
+        decoded = SerialisableArray.decode(SerialisableArray.encode(values, "int16"), "int16")
+        self.assertEqual(decoded, values)
+
+    def test_same_bytes_as_numpy(self):
+        self.assertEqual(SerialisableArray.encode([1, 258], "uint16").to_bytes(),
+                         b"\x02\xa0\x00\x01\x01\x02")
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            SerialisableArray.encode([256], "uint8")
+
+    def test_not_numbers(self):
+        with self.assertRaises(ValueError):
+            SerialisableArray.encode(["a"], "float32")
+
+    def test_more_dimensions(self):
+        with self.assertRaises(ValueError):
+            SerialisableArray.encode([[1]], "int8", (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from src.main import StoredData
+from src.main.serialise_data import SerialiseData
+from src.main.types import RefStats, SerialisableIndexedList, SerialisableInt, \
+    SerialisableList, SerialisableObject, SerialisableRef, SerialisableVarInt, \
+    SerialisableVarString
+
+
+class Tag(SerialisableObject):
+    version_map = {0: [SerialiseData("code", SerialisableInt(0, 16)),
+                       SerialiseData("name", SerialisableVarString())]}
+
+    def __init__(self, code: int = 0, name: str = "") -> None:
+        super().__init__()
+        self.code = code
+        self.name = name
+
+
+NAMES = ["alpha", "a much longer repeated value", "alpha", "beta",
+         "a much longer repeated value", "alpha"]
+
+
+class SerialisableRefTest(unittest.TestCase):
+    ref = SerialisableRef(value_type=SerialisableVarString())
+
+    def test_round_trip(self):
+        data = SerialisableList.encode(NAMES, self.ref)
+        self.assertEqual(SerialisableList.decode(data, self.ref), NAMES)
+
+    def test_repeats_are_smaller(self):
+        plain = SerialisableList.encode(NAMES, SerialisableVarString())
+        self.assertLess(SerialisableList.encode(NAMES, self.ref).bit_length, plain.bit_length)
+
+    def test_back_reference_bits(self):
+        data = SerialisableList.encode(["long value", "long value"], self.ref, bit_size=4)
+        first = 1 + SerialisableVarString.encode("long value").bit_length
+        self.assertEqual(data.read_int_at(4, 1), 0)
+        self.assertEqual(data.read_int_at(4 + first, 1), 1)
+        self.assertEqual(SerialisableVarInt.decode_at(data, 4 + first + 1)[0], first)
+
+    def test_stats(self):
+        stats = RefStats()
+        ref = SerialisableRef(value_type=SerialisableVarString(), stats=stats)
+        SerialisableList.encode(NAMES, ref)
+        self.assertEqual((stats.values, stats.references), (3, 3))
+        self.assertGreater(stats.saved_bits, 0)
+        self.assertEqual(stats.as_dict()["values"], 3)
+
+    def test_short_values_written_in_full(self):
+        stats = RefStats()
+        ref = SerialisableRef(value_type=SerialisableInt(0, 4), stats=stats)
+        data = SerialisableList.encode([3, 3, 3], ref)
+        self.assertEqual(stats.references, 0)
+        self.assertEqual(SerialisableList.decode(data, ref), [3, 3, 3])
+
+    def test_max_refs(self):
+        stats = RefStats()
+        ref = SerialisableRef(value_type=SerialisableVarString(), max_refs=1, stats=stats)
+        values = ["first value", "second value", "first value"]
+        data = SerialisableList.encode(values, ref)
+        self.assertEqual(stats.references, 0)
+        self.assertEqual(SerialisableList.decode(data, ref), values)
+
+    def test_objects_shared_within_one_decode(self):
+        ref = SerialisableRef(value_type=Tag())
+        tags = [Tag(1, "one"), Tag(1, "one"), Tag(2, "two")]
+        data = SerialisableList.encode(tags, ref)
+        decoded = SerialisableList.decode(data, ref)
+        self.assertIs(decoded[0], decoded[1])
+        self.assertEqual([(tag.code, tag.name) for tag in decoded],
+                         [(1, "one"), (1, "one"), (2, "two")])
+
+    def test_decodes_do_not_share_objects(self):
+        ref = SerialisableRef(value_type=Tag())
+        data = SerialisableList.encode([Tag(1, "one"), Tag(1, "one")], ref)
+        first = SerialisableList.decode(data, ref)
+        first[1].code = 999
+        again = SerialisableList.decode(data, ref)
+        self.assertIsNot(again[1], first[1])
+        self.assertEqual(again[1].code, 1)
+
+    def test_encodes_do_not_share_tables(self):
+        first = SerialisableList.encode(NAMES, self.ref)
+        self.assertEqual(SerialisableList.encode(NAMES, self.ref).to_bytes(), first.to_bytes())
+
+    def test_relative_references_at_any_offset(self):
+        data = StoredData()
+        data.add_int(3, 5)
+        SerialisableList.encode_into(data, NAMES, self.ref)
+        self.assertEqual(SerialisableList.decode_at(data, 5, self.ref)[0], NAMES)
+
+    def test_indexed_list_items(self):
+        data = SerialisableIndexedList.encode(NAMES, self.ref)
+        self.assertEqual(SerialisableIndexedList.decode(data, self.ref), NAMES)
+
+    def test_reference_before_start(self):
+        data = StoredData()
+        data.add_int(1, 1)
+        SerialisableVarInt.encode_into(data, 50)
+        with self.assertRaises(ValueError):
+            self.ref.deseralise(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
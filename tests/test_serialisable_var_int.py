@@ -0,0 +1,63 @@
+import unittest
+
+from src.main import StoredData
+from src.main.types import SerialisableVarInt
+
+
+class SerialisableVarIntTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        for value in (0, 1, 127, 128, 300, 16383, 16384, 2 ** 63, 2 ** 200):
+            with self.subTest(value=value):
+                self.assertEqual(SerialisableVarInt.decode(SerialisableVarInt.encode(value)),
+                                 value)
+
+    def test_signed_round_trip(self):
+        for value in (0, -1, 1, -64, 63, -65, 2 ** 40, -2 ** 40):
+            with self.subTest(value=value):
+                encoded = SerialisableVarInt.encode(value, signed=True)
+                self.assertEqual(SerialisableVarInt.decode(encoded, signed=True), value)
+
+    def test_leb128_bytes(self):
+        # Low 7 bit groups first, with the high bit set on every group but the last.
+        self.assertEqual(SerialisableVarInt.encode(0).to_bytes(), b"\x00")
+        self.assertEqual(SerialisableVarInt.encode(127).to_bytes(), b"\x7f")
+        self.assertEqual(SerialisableVarInt.encode(128).to_bytes(), b"\x80\x01")
+        self.assertEqual(SerialisableVarInt.encode(300).to_bytes(), b"\xac\x02")
+        self.assertEqual(SerialisableVarInt.encode(-1, signed=True).to_bytes(), b"\x01")
+        self.assertEqual(SerialisableVarInt.encode(1, signed=True).to_bytes(), b"\x02")
+
+    def test_zigzag(self):
+        self.assertEqual([SerialisableVarInt.zigzag(value) for value in (0, -1, 1, -2, 2)],
+                         [0, 1, 2, 3, 4])
+        for value in range(-300, 300):
+            self.assertEqual(SerialisableVarInt.unzigzag(SerialisableVarInt.zigzag(value)), value)
+
+    def test_decode_at_unaligned_offset(self):
+        data = StoredData()
+        data.add_int(5, 3)
+        SerialisableVarInt.encode_into(data, 1000)
+        SerialisableVarInt.encode_into(data, 7)
+        value, offset = SerialisableVarInt.decode_at(data, 3)
+        self.assertEqual((value, offset), (1000, 19))
+        self.assertEqual(SerialisableVarInt.decode_at(data, offset), (7, 27))
+
+    def test_deseralise_moves_pointer(self):
+        data = SerialisableVarInt.encode(300)
+        SerialisableVarInt.encode_into(data, 5)
+        var_int = SerialisableVarInt()
+        self.assertEqual(var_int.deseralise(data), 300)
+        self.assertEqual(var_int.deseralise(data), 5)
+
+    def test_negative_unsigned(self):
+        with self.assertRaises(ValueError):
+            SerialisableVarInt.encode(-1)
+
+    def test_truncated(self):
+        data = StoredData.from_bytes(b"\x80\x80")
+        with self.assertRaises(ValueError):
+            SerialisableVarInt.decode(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from src.main.serialise_data import SerialiseData
+from src.main.types import (SerialisableArray, SerialisableInt, SerialisableObject,
+                            SerialisableRef, SerialisableVarString, TrackedObject)
+
+FIELDS = [
+    SerialiseData("flags", SerialisableInt(0, 3)),
+    SerialiseData("name", SerialisableRef(value_type=SerialisableVarString())),
+    SerialiseData("alias", SerialisableRef(value_type=SerialisableVarString())),
+    SerialiseData("note", SerialisableVarString()),
+    SerialiseData("samples", SerialisableArray(dtype="int16")),
+]
+
+
+class Plain(SerialisableObject):
+    version_map = {0: FIELDS}
+
+    def __init__(self, flags=0, name="", alias="", note="", samples=()) -> None:
+        super().__init__()
+        self.flags = flags
+        self.name = name
+        self.alias = alias
+        self.note = note
+        self.samples = list(samples)
+
+
+class Tracked(TrackedObject, Plain):
+    version_map = {0: FIELDS}
+
+
+class TrackedObjectTest(unittest.TestCase):
+    values = dict(flags=5, name="sensor one", alias="sensor one", note="n", samples=range(9))
+
+    def assert_same_bits(self, tracked: Tracked) -> None:
+        plain = Plain()
+        plain.__dict__.update({key: value for key, value in tracked.__dict__.items()
+                               if not key.startswith("_")})
+        expected = Plain.encode(plain)
+        encoded = Tracked.encode(tracked)
+        self.assertEqual(encoded.bit_length, expected.bit_length)
+        self.assertEqual(encoded.to_bytes(), expected.to_bytes())
+
+    def test_first_encode_matches_untracked(self):
+        self.assert_same_bits(Tracked(**self.values))
+
+    def test_reencode_after_changes_matches_untracked(self):
+        tracked = Tracked(**self.values)
+        Tracked.encode(tracked)
+        for note in ("a longer note", "", "odd"):  # Moves the array to other bits of a byte.
+            tracked.note = note
+            self.assert_same_bits(tracked)
+        tracked.alias = "other"
+        self.assert_same_bits(tracked)
+
+    def test_in_place_change_needs_mark_dirty(self):
+        tracked = Tracked(**self.values)
+        before = Tracked.encode(tracked).to_bytes()
+        tracked.samples.append(100)
+        self.assertEqual(Tracked.encode(tracked).to_bytes(), before)
+        tracked.mark_dirty("samples")
+        self.assert_same_bits(tracked)
+
+    def test_round_trip(self):
+        tracked = Tracked(**self.values)
+        decoded = Tracked.decode(Tracked.encode(tracked), Tracked)
+        self.assertEqual(decoded.name, "sensor one")
+        self.assertEqual(decoded.alias, "sensor one")
+        self.assertEqual(list(decoded.samples), list(range(9)))
+
+
+if __name__ == "__main__":
+    unittest.main()